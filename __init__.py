@@ -5,13 +5,16 @@ from emoji_data.data_dict_retrieval import *
 __all__ = [
     # emojix.core
     "KEYCHAIN", "CATS_KEYCHAIN",
-    "category_exists", "category", "get_all_categories", 
+    "category_exists", "category", "category_of_many", "categorize_text", "get_all_categories", 
     "top_level_categories", "sub_level_categories", "is_top_level_category", "parent_category", "child_categories", "iterate_category", "emoji_factory", "get_emojis_in_category", "is_emoji_variation", "get_all_emoji_variants", "emoji_to_unicode", "emoji_name", "get_emoji_by_name",
-    "has_zwj", "emojize", "demojize", "analyze", "config",
-    "emoji_list", "distinct_emoji_list", "emoji_count",
-    "replace_emoji", "is_emoji", "purely_emoji", "version",
+    "emoji_name_many", "get_emoji_by_name_many", "suggest", "fuzzy_lookup",
+    "has_zwj", "emojize", "Emojizer", "demojize", "analyze", "config",
+    "emoji_list", "distinct_emoji_list", "emoji_count", "emoji_matches",
+    "emojize_many", "demojize_many", "emoji_list_many",
+    "replace_emoji", "is_emoji", "has_emoji", "purely_emoji", "version",
+    "emojis_up_to_version", "emojis_in_version_range", "allowed_set", "emojis_containing", "base_of", "variants_of",
     # emojix.tokenize
-    "Token", "EmojiMatch", "EmojiMatchZWJ", "EmojiMatchZWJNonRGI",
+    "Token", "EmojiMatch", "EmojiMatchZWJ", "EmojiMatchZWJNonRGI", "EmojiMatches", "get_emoji_regex",
     "EMOJI_DATA", "STATUS", "LANGUAGES", "CATEGORIES", "BASIC_EMOJIS"
     # emojix.emoji_data.data_dict_retrieval
     "key_chain", "categories_key_chain", "emoji_data", "get_emoji_data_for_lang",
@@ -1,6 +1,8 @@
 from core import (
     category_exists as category_exists,
     category as category,
+    category_of_many as category_of_many,
+    categorize_text as categorize_text,
     get_all_categories as get_all_categories,
     top_level_categories as top_level_categories,
     sub_level_categories as sub_level_categories,
@@ -15,15 +17,31 @@ from core import (
     emoji_to_unicode as emoji_to_unicode,
     emoji_name as emoji_name,
     get_emoji_by_name as get_emoji_by_name,
+    emoji_name_many as emoji_name_many,
+    get_emoji_by_name_many as get_emoji_by_name_many,
+    suggest as suggest,
+    fuzzy_lookup as fuzzy_lookup,
     has_zwj as has_zwj,
     demojize as demojize,
     distinct_emoji_list as distinct_emoji_list,
     emoji_count as emoji_count,
     emoji_list as emoji_list,
+    emoji_matches as emoji_matches,
     emojize as emojize,
+    Emojizer as Emojizer,
+    emojize_many as emojize_many,
+    demojize_many as demojize_many,
+    emoji_list_many as emoji_list_many,
     is_emoji as is_emoji,
+    has_emoji as has_emoji,
     replace_emoji as replace_emoji,
     version as version,
+    emojis_up_to_version as emojis_up_to_version,
+    emojis_in_version_range as emojis_in_version_range,
+    allowed_set as allowed_set,
+    emojis_containing as emojis_containing,
+    base_of as base_of,
+    variants_of as variants_of,
     analyze as analyze,
     config as config, 
 )
@@ -33,6 +51,8 @@ from tokenizer import (
     EmojiMatch as EmojiMatch,
     EmojiMatchZWJ as EmojiMatchZWJ,
     EmojiMatchZWJNonRGI as EmojiMatchZWJNonRGI,
+    EmojiMatches as EmojiMatches,
+    get_emoji_regex as get_emoji_regex,
 )
 
 from emoji_data import EMOJI_DATA, LANGUAGES, STATUS
@@ -48,14 +68,18 @@ from emoji_data.data_dict_retrieval import (
 
 __all__ = [
     # emoji.core
-    "category_exists", "category", "get_all_categories", "top_level_categories",
+    "category_exists", "category", "category_of_many", "categorize_text",
+    "get_all_categories", "top_level_categories",
     "sub_level_categories", "is_top_level_category", "parent_category", "child_categories",
     "iterate_category", "emoji_factory", "get_emojis_in_category", "is_emoji_variation",
     "get_all_emoji_variants", "emoji_to_unicode", "emoji_name", "get_emoji_by_name",
-    "has_zwj", "emojize", "demojize", "analyze", "config",
-    "emoji_list", "distinct_emoji_list", "emoji_count",
-    "replace_emoji", "is_emoji", "version",
-    "Token", "EmojiMatch", "EmojiMatchZWJ", "EmojiMatchZWJNonRGI",
+    "emoji_name_many", "get_emoji_by_name_many", "suggest", "fuzzy_lookup",
+    "has_zwj", "emojize", "Emojizer", "demojize", "analyze", "config",
+    "emoji_list", "distinct_emoji_list", "emoji_count", "emoji_matches",
+    "emojize_many", "demojize_many", "emoji_list_many",
+    "replace_emoji", "is_emoji", "has_emoji", "version",
+    "emojis_up_to_version", "emojis_in_version_range", "allowed_set", "emojis_containing", "base_of", "variants_of",
+    "Token", "EmojiMatch", "EmojiMatchZWJ", "EmojiMatchZWJNonRGI", "EmojiMatches", "get_emoji_regex",
     # emojix.emoji_data
     "EMOJI_DATA", "STATUS", "LANGUAGES",
     # emojix.data_dict_retrieval
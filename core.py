@@ -6,22 +6,31 @@ Core components for emojix derived from https://www.github.com/carpedm20/emoji.
 
 """
 
+import heapq
 import re
 import unicodedata
-from typing import Any, Dict, List, Iterator
-from tokenizer import Token, EmojiMatch, EmojiMatchZWJ, EmojiMatchZWJNonRGI, tokenize, filter_tokens
-from emoji_data.data_dict_retrieval import _EMOJI_ALIASES_CACHE, _EMOJI_LANG_CACHE, emoji_data, key_chain, categories_key_chain, get_emoji_aliases_data, get_emoji_data_for_lang
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Iterator, Mapping, NamedTuple, Tuple
+from tokenizer import PhraseAutomaton, Token, EmojiMatch, EmojiMatches, EmojiMatchZWJ, EmojiMatchZWJNonRGI, tokenize, tokenize_spans, tokenize_bytes, iter_matches, filter_tokens, get_automaton, get_emoji_regex, get_trie_pattern, get_emoji_start_chars
+from emoji_data.data_dict_retrieval import _EMOJI_ALIASES_CACHE, _EMOJI_LANG_CACHE, emoji_data, key_chain, categories_key_chain, get_emoji_aliases_data, get_emoji_data_for_lang, get_emoji_name_index, get_emoji_shortcode_table
 from emoji_data.data_dict import EMOJI_DATA, CATEGORIES, LANGUAGES, STATUS
 
 __all__ = [
-    "category_exists", "category", "get_all_categories", "top_level_categories",
+    "category_exists", "category", "category_of_many", "categorize_text",
+    "get_all_categories", "top_level_categories",
     "sub_level_categories", "is_top_level_category", "parent_category", "child_categories",
     "iterate_category", "emoji_factory", "get_emojis_in_category", "is_emoji_variation",
     "get_all_emoji_variants", "emoji_to_unicode", "emoji_name", "get_emoji_by_name",
-    "has_zwj", "emojize", "demojize", "replace_emoji", "emoji_list", "distinct_emoji_list",
-    "emoji_count", "is_emoji", "purely_emoji", "version", "has_alias", "alias"
+    "emoji_name_many", "get_emoji_by_name_many", "suggest", "fuzzy_lookup",
+    "has_zwj", "emojize", "Emojizer", "demojize", "replace_emoji", "emoji_list", "distinct_emoji_list",
+    "emoji_count", "emoji_matches", "emojize_many", "demojize_many", "emoji_list_many", "is_emoji", "has_emoji", "purely_emoji", "version",
+    "emojis_up_to_version", "emojis_in_version_range", "allowed_set", "emojis_containing", "base_of", "variants_of", "has_alias", "alias"
     "Token", "EmojiMatch", "EmojiMatchZWJ", "EmojiMatchZWJNonRGI", "KEYCHAIN", "CATS_KEYCHAIN", "emoji_data", "key_chain", "categories_key_chain", 
-    "get_emoji_aliases_data", "get_emoji_data_for_lang" 
+    "get_emoji_aliases_data", "get_emoji_data_for_lang", "get_emoji_regex", "EmojiMatches"
 ]
 
 _DEFAULT_DELIMITER = ':'
@@ -63,44 +72,180 @@ class config():
     See :attr:`config.demojize_keep_zwj` for more information.
     """
 
+    tokenize_backend = 'tree'
+    """The matcher that :func:`emoji.analyze()` uses to find emoji unless
+    ``spans`` is True. :func:`emoji.demojize()`, :func:`emoji.replace_emoji()` and
+    :func:`emoji.analyze()` with ``spans=True`` always use
+    :func:`tokenizer.tokenize_spans`, :func:`emoji.emoji_list()`,
+    :func:`emoji.emoji_count()` and :func:`emoji.has_emoji()` always use
+    :func:`tokenizer.iter_matches`.
+
+    ``'tree'`` walks the nested dicts of the search tree, ``'automaton'`` walks
+    the compiled flat automaton which needs a fraction of the memory and
+    ``'regex'`` uses :func:`emoji.get_emoji_regex()` to skip plain text in C.
+    All of them find exactly the same emoji and none of them is faster than
+    ``'tree'``. See :func:`tokenizer.tokenize` for more information.
+    """
+
 KEYCHAIN = key_chain()
 CATS_KEYCHAIN = categories_key_chain()
 
-def category_exists(category: str=None, category_id: int=None) -> bool:
-    if category_id is not None:
+_CATEGORY_INDEX = None  # Cache for the emoji per category and subcategory
+_CATEGORY_PARENTS = None  # Cache for the parent of each subcategory
+_CATEGORY_CHILDREN = None  # Cache for the subcategories of each category
+_CATEGORY_SETS = None  # Cache for the sets of valid category names and ids
+_CATEGORY_RECORDS = {}  # Cache for the read-only results of category() per emoji
+_VARIANT_SETS = None  # Cache for the sets of variant and aliased emoji
+_VERSION_INDEX = None  # Cache for the emoji sorted by version
+_ALLOWED_SETS = {}  # Cache for the results of allowed_set() per number of emoji
+_SHORTCODE_INDEX = {}  # Cache for the sorted names per language for suggest()
+_FUZZY_INDEX = {}  # Cache for the trigram index per language for fuzzy_lookup()
+_FUZZY_MIN_SIMILARITY = 0.5  # Least similarity of a name that emojize(fuzzy=True) accepts
+_CODEPOINT_INDEX = None  # Cache for the emoji per code point for emojis_containing()
+_MODIFIER_GRAPH = None  # Cache for the links between base emoji and their variants
+_NO_VARIANTS = MappingProxyType({})
+# Multi-person sequences with two skin tones whose base emoji is a single character
+_MODIFIER_GROUPS = {
+    '🧑\u200d❤\u200d💋\u200d🧑': '💏', '🧑\u200d❤\u200d🧑': '💑', '🫱\u200d🫲': '🤝',
+    '👩\u200d🤝\u200d👩': '👭', '👩\u200d🤝\u200d👨': '👫', '👨\u200d🤝\u200d👨': '👬'}
+# Skin tones, and hair styles and genders that are joined to a person with a ZWJ
+_MODIFIER_REGEX = re.compile('([\U0001F3FB-\U0001F3FF])|\u200d([\U0001F9B0-\U0001F9B3]|[\u2640\u2642])\ufe0f?')
+_EMOJIZERS = {}  # Cache for the Emojizer of emojize() per settings, least recently used first
+_EMOJIZERS_SIZE = 32  # Maximum number of cached Emojizer
+_SHORTCODE_PATTERNS = {}  # Cache for the patterns of the names per language for emojize()
+_WORD_AUTOMATA = {}  # Cache for the automaton of the names per language for emojize(bare_words=True)
+_DEMOJIZE_TABLES = {}  # Cache for the output of demojize() per emoji per settings, least recently used first
+_DEMOJIZE_TABLES_SIZE = 32  # Maximum number of cached tables
+
+class _CategorySets(NamedTuple):
+    names: FrozenSet[str]
+    """Names of the categories and subcategories that have emoji in EMOJI_DATA"""
+    top_level_names: FrozenSet[str]
+    """Names of the categories in CATEGORIES"""
+    ids: FrozenSet[int]
+    """Ids of the categories and subcategories in CATEGORIES"""
+    top_level_ids: FrozenSet[int]
+    """Ids of the categories in CATEGORIES"""
+
+def _get_category_sets() -> _CategorySets:
+    global _CATEGORY_SETS
+    if _CATEGORY_SETS is None:
+        _CATEGORY_SETS = _CategorySets(
+            names=frozenset(data[field] for data in EMOJI_DATA.values()
+                            for field in ("category", "subcategory")),
+            top_level_names=frozenset(CATS_KEYCHAIN),
+            ids=frozenset(sub_id for key in CATS_KEYCHAIN for sub_id in CATEGORIES[key].values()),
+            top_level_ids=frozenset(CATEGORIES[key]["id"] for key in CATS_KEYCHAIN))
+    return _CATEGORY_SETS
+
+def _get_category_index() -> Dict[str | int, Tuple[str, ...]]:
+    # Maps the name and the id of every category and subcategory to its emoji
+    # in the order of EMOJI_DATA. No category shares a name or an id with a
+    # subcategory, so each key stands for exactly one of them.
+    global _CATEGORY_INDEX
+    if _CATEGORY_INDEX is None:
+        index = {}
+        for emj, data in EMOJI_DATA.items():
+            for field in ("category", "category_id", "subcategory", "subcategory_id"):
+                index.setdefault(data[field], []).append(emj)
+        _CATEGORY_INDEX = {key: tuple(emojis) for key, emojis in index.items()}
+    return _CATEGORY_INDEX
+
+def _category_emojis(key: str | int) -> List[Dict[str, Any]]:
+    # The data of the emoji in a category or subcategory
+    return [EMOJI_DATA[emj] for emj in _get_category_index().get(key, ())]
+
+def _get_category_parents() -> Dict[str | int, str]:
+    # Maps the name and the id of every subcategory and the id of every
+    # category to the name of its category, see parent_category()
+    global _CATEGORY_PARENTS
+    if _CATEGORY_PARENTS is None:
+        _CATEGORY_PARENTS = {}
+        for key in CATS_KEYCHAIN:
+            for subkey, sub_id in CATEGORIES[key].items():
+                if subkey != "id":
+                    _CATEGORY_PARENTS[subkey] = key
+                _CATEGORY_PARENTS[sub_id] = key
+    return _CATEGORY_PARENTS
+
+def _get_category_children() -> Dict[str | int, Tuple[Tuple[str, int], ...]]:
+    # Maps the name and the id of every category to the names and ids of its subcategories
+    global _CATEGORY_CHILDREN
+    if _CATEGORY_CHILDREN is None:
+        _CATEGORY_CHILDREN = {}
         for key in CATS_KEYCHAIN:
             CATKEY = CATEGORIES[key]
-            if CATKEY["id"] == category_id:
-                return True
-            for subkey in CATKEY.keys():
-                if CATKEY[subkey] == category_id:
-                    return True
-    for key in KEYCHAIN:
-        KEY = EMOJI_DATA[key]
-        if category == KEY["category"]:
-            return True
-        if category == KEY["subcategory"]:
-            return True
-    return False
+            children = tuple((subkey, CATKEY[subkey]) for subkey in CATKEY if subkey != "id")
+            _CATEGORY_CHILDREN[key] = _CATEGORY_CHILDREN[CATKEY["id"]] = children
+    return _CATEGORY_CHILDREN
+
+class _VariantSets(NamedTuple):
+    variants: FrozenSet[str]
+    """Emoji whose "variant" is True"""
+    variants_data: Tuple[Dict[str, Any], ...]
+    """Data of the variant emoji in the order of EMOJI_DATA"""
+    aliased: FrozenSet[str]
+    """Emoji with an alias that differs from their name"""
+
+class _ModifierGraph(NamedTuple):
+    bases: Dict[str, str]
+    """Base emoji of each emoji with modifiers"""
+    variants: Dict[str, Mapping[Tuple[str, ...], str]]
+    """Emoji with modifiers of each base emoji, by their modifiers"""
+
+def _get_variant_sets() -> _VariantSets:
+    global _VARIANT_SETS
+    if _VARIANT_SETS is None:
+        variants_data = tuple(data for data in EMOJI_DATA.values() if data["variant"] is True)
+        _VARIANT_SETS = _VariantSets(
+            variants=frozenset(data["emoji"] for data in variants_data),
+            variants_data=variants_data,
+            aliased=frozenset(emj for emj, data in EMOJI_DATA.items()
+                              if data.get("alias") and data["alias"][0] != data["name"]))
+    return _VARIANT_SETS
+
+def category_exists(category: str=None, category_id: int=None) -> bool:
+    sets = _get_category_sets()
+    return category_id in sets.ids or category in sets.names
 
-def category(emoji: str) -> (Dict | List[Dict] | None):
-    categories = []
-    for i in range(len(emoji)):
-        if is_emoji(emoji):                    
-            for key in KEYCHAIN:
-                KEY = EMOJI_DATA[key]
-                if key == emoji:
-                    data = {}
-                    data["emoji"] = key
-                    data["category"] = KEY["category"]
-                    data["category_id"] = KEY["category_id"]
-                    data["subcategory"] = KEY["subcategory"]
-                    data["subcategory_id"] = KEY["subcategory_id"]
-                    if data not in categories:
-                        categories.append(data)
-    if len(categories) > 1:
-        return categories
-    return data
+def category(emoji: str) -> (Mapping[str, Any] | None):
+    """
+    Returns the category and subcategory of an emoji or None if it is not an emoji.
+    The record is read-only and cached, so repeated calls return the same object.
+        >>> emoji.category("🎃")["subcategory"]
+        'event'
+    """
+    record = _CATEGORY_RECORDS.get(emoji)
+    if record is None:
+        data = EMOJI_DATA.get(emoji)
+        if data is None:
+            return None
+        record = _CATEGORY_RECORDS[emoji] = MappingProxyType({
+            "emoji": emoji,
+            "category": data["category"],
+            "category_id": data["category_id"],
+            "subcategory": data["subcategory"],
+            "subcategory_id": data["subcategory_id"],
+        })
+    return record
+
+def category_of_many(emojis: Iterable[str]) -> List[Mapping[str, Any] | None]:
+    """
+    Like :func:`category` for every emoji of an iterable.
+    """
+    return [category(emj) for emj in emojis]
+
+def categorize_text(text: str) -> List[Mapping[str, Any]]:
+    """
+    Returns the :func:`category` of every emoji in a text, in the order of
+    :func:`emoji_list`. The text is tokenized only once.
+        >>> [record["category"] for record in emoji.categorize_text("Hi 🎃 and 👍")]
+        ['activities', 'people_and_body']
+    """
+    if not _may_contain_emoji(text):
+        return []
+    emojis = get_automaton().emojis
+    return [category(emojis[index]) for _, _, index in iter_matches(text, keep_zwj=False)]
 
 def get_all_categories() -> Dict:
     return CATEGORIES
@@ -123,159 +268,69 @@ def sub_level_categories() -> List[Dict[str, int]]:
     return sub_lvl_categories
 
 def is_top_level_category(category: str=None, category_id: int=None) -> (bool | None):
-    if category_id is not None and category_exists(category_id=category_id):
-        for key in CATS_KEYCHAIN:
-            if CATEGORIES[key]["id"] == category_id:
-                return True
-        return False
-    if category_id is None and category is not None and category_exists(category):
-        for key in CATS_KEYCHAIN:
-            if key == category:
-                return True
-        return False
+    sets = _get_category_sets()
+    if category_id is not None and category_id in sets.ids:
+        return category_id in sets.top_level_ids
+    if category_id is None and category in sets.names:
+        return category in sets.top_level_names
     return None
 
 def parent_category(category: str=None, category_id: int=None, emojis_in_category: bool=False) -> (str | None): 
     if category_id is not None and category_exists(category_id=category_id):
-        for key in CATS_KEYCHAIN:
-            CATKEY = CATEGORIES[key]
-            for subkey in CATKEY.keys():
-                if CATKEY[subkey] == category_id:
-                    if not emojis_in_category:
-                        data = {"category": key, "id": CATKEY["id"]}
-                        return data
-                    emojis = []
-                    for edkey in KEYCHAIN:
-                        KEY = EMOJI_DATA[edkey]
-                        if KEY["category"] == key:
-                            emojis.append(KEY)
-                    return emojis
-    if category_id is None and category is not None and category_exists(category):
-        for key in CATS_KEYCHAIN:
-            CATKEY = CATEGORIES[key]
-            for subkey in CATKEY.keys():
-                if subkey == category:
-                    if not emojis_in_category:
-                        return {"category": key, "id": CATEGORIES[key]["id"]}
-                    emojis = []
-                    for edkey in KEYCHAIN:
-                        KEY = EMOJI_DATA[edkey]
-                        if KEY["category"] == key:
-                            emojis.append(KEY)
-                    return emojis
+        key = _get_category_parents()[category_id]
+    elif category_id is None and category is not None and category_exists(category):
+        key = _get_category_parents().get(category)
+        if key is None:
+            return None
+    else:
+        return None
+    if not emojis_in_category:
+        return {"category": key, "id": CATEGORIES[key]["id"]}
+    return _category_emojis(key)
 
 def child_categories(category: str=None, category_id: int=None, emojis_in_category: bool=False) -> (List[str] | None):
-    child_categories = []
     if category_id is not None and category_exists(category_id=category_id):
-        for key in CATS_KEYCHAIN:
-            CATKEY = CATEGORIES[key]
-            if CATKEY["id"] == category_id:
-                for subkey in CATKEY.keys():
-                    if subkey == "id":
-                        continue
-                    if not emojis_in_category:
-                        data = {"subcategory": subkey, "id": CATKEY[subkey]}
-                        child_categories.append(data)
-                        continue
-                    emojis = []
-                    for edkey in KEYCHAIN:
-                        KEY = EMOJI_DATA[edkey]
-                        if KEY["subcategory"] == subkey:
-                            emojis.append(KEY)
-                    data = {"subcategory": subkey, "id": CATKEY[subkey], "emojis": emojis}
-                    child_categories.append(data)
-        return child_categories
-    if category is not None and category_exists(category):
-        for key in CATS_KEYCHAIN:
-            CATKEY = CATEGORIES[key]
-            if key == category:
-                for subkey in CATKEY.keys():
-                    if subkey == "id":
-                        continue
-                    if not emojis_in_category:
-                        data = {"subcategory": subkey, "id": CATKEY[subkey]}
-                        child_categories.append(data)
-                        continue
-                    emojis = []
-                    for edkey in KEYCHAIN:
-                        KEY = EMOJI_DATA[edkey]
-                        if KEY["subcategory"] == subkey:
-                            emojis.append(KEY)
-                    data = {"subcategory": subkey, "id": CATKEY[subkey], "emojis": emojis}
-                    child_categories.append(data)
-    return child_categories
+        children = _get_category_children().get(category_id, ())
+    elif category is not None and category_exists(category):
+        children = _get_category_children().get(category, ())
+    else:
+        return []
+    if not emojis_in_category:
+        return [{"subcategory": subkey, "id": sub_id} for subkey, sub_id in children]
+    return [{"subcategory": subkey, "id": sub_id, "emojis": _category_emojis(subkey)}
+            for subkey, sub_id in children]
 
 def iterate_category(func: object, func_args: list=None, category: str=None, category_id: int=None) -> None:
-    category_items = []
-    if category_id is not None and category_exists(category_id=category_id): 
-        for key in KEYCHAIN:
-            KEY = EMOJI_DATA[key]
-            if KEY["category_id"] == category_id:
-                category_items.append(KEY)
-            if KEY["subcategory_id"] == category_id:
-                category_items.append(KEY)
-    if category_id is None and category is not None and category_exists(category):
-        for key in KEYCHAIN:
-            KEY = EMOJI_DATA[key]
-            if KEY["category"] == category:
-                category_items.append(KEY)
-            if KEY["subcategory"] == category:
-                category_items.append(KEY)
-    for i in range(len(category_items)):
-        func(category_items[i], func_args)
+    if category is None and category_id is None:
+        return None
+    for item in emoji_factory(category, category_id):
+        func(item, func_args)
 
 def emoji_factory(category: str=None, category_id: int=None) -> (str | None):
     if category_id is not None and category_exists(category_id=category_id):
-        for key in KEYCHAIN:
-            KEY = EMOJI_DATA[key]
-            if KEY["category_id"] == category_id:
-                yield KEY
-            if KEY["subcategory_id"] == category_id:
-                yield KEY
+        yield from _category_emojis(category_id)
     if category_id is None and category is not None and category_exists(category):
-        for key in KEYCHAIN:
-            KEY = EMOJI_DATA[key]
-            if KEY["category"] == category:
-                yield KEY
-            if KEY["subcategory"] == category:
-                yield KEY
+        yield from _category_emojis(category)
     if category is None and category_id is None:
-        for key in KEYCHAIN:
-            yield key
+        yield from KEYCHAIN
     return None
 
 def get_emojis_in_category(category: str=None, category_id: int=None) -> List[str]:
-    emojis = []
     if category_id is not None:
-        if category_exists(category_id=category_id):
-            for key in KEYCHAIN:
-                KEY = EMOJI_DATA[key]
-                if KEY["category_id"] == category_id:
-                    emojis.append(KEY)
-    if category_id is None and category is not None:
-        if category_exists(category):
-            for key in KEYCHAIN:
-                KEY = EMOJI_DATA[key]
-                if KEY["category"] == category:
-                    emojis.append(KEY)
-                if KEY["subcategory"] == category:
-                    emojis.append(KEY)
-    return emojis
+        if category_id in _get_category_sets().top_level_ids:
+            return _category_emojis(category_id)
+        return []
+    if category is not None and category_exists(category):
+        return _category_emojis(category)
+    return []
 
 def is_emoji_variation(emoji: str) -> (bool | None):
     if is_emoji(emoji):
-        for key in KEYCHAIN:
-            if key == emoji:
-                return EMOJI_DATA[key]["variant"]
+        return emoji in _get_variant_sets().variants
     return None
 
 def get_all_emoji_variants() -> List[Dict[str, Any]]:
-    variants = []
-    for key in KEYCHAIN:
-        KEY = EMOJI_DATA[key]
-        if KEY["variant"] is True:
-            variants.append(KEY)
-    return variants    
+    return list(_get_variant_sets().variants_data)
 
 def emoji_to_unicode(emoji: str | List[str]) -> (str | List[str]):
     unicode_values = []
@@ -286,20 +341,279 @@ def emoji_to_unicode(emoji: str | List[str]) -> (str | List[str]):
         unicode_strings.append(f"U+{codepoint:04X}")        
     return unicode_strings
 
-def emoji_name(emoji: str) -> (str | None):
-    if is_emoji(emoji):
-        for key in KEYCHAIN:
-            KEY = EMOJI_DATA[key]
-            if key == emoji:
-                return KEY["name"]
-    return None
+def _get_codepoint_index() -> Dict[int, FrozenSet[str]]:
+    # The emoji that contain a code point, per code point
+    global _CODEPOINT_INDEX
+    if _CODEPOINT_INDEX is None:
+        index = {}
+        for emj in EMOJI_DATA:
+            for char in emj:
+                index.setdefault(ord(char), set()).add(emj)
+        _CODEPOINT_INDEX = {codepoint: frozenset(emojis) for codepoint, emojis in index.items()}
+    return _CODEPOINT_INDEX
+
+def _codepoint(value: int | str) -> int:
+    if isinstance(value, int):
+        return value
+    if value[:2].upper() == 'U+':
+        try:
+            return int(value[2:], 16)
+        except ValueError:
+            pass
+    elif len(value) == 1:
+        return ord(value)
+    raise ValueError(f"Invalid code point {value!r}")
+
+def emojis_containing(codepoints: int | str | Iterable[int | str]) -> FrozenSet[str]:
+    """
+    Returns the set of emoji that contain all of the given code points.
+        >>> sorted(emoji.emojis_containing("U+1F3FB"))[:2]
+        ['☝🏻', '⛹🏻']
+        >>> emoji.emojis_containing("👍🏻")
+        frozenset({'👍🏻'})
+
+    :param codepoints: A code point as ``int`` or ``'U+1F3FB'``, a string of
+        characters like an emoji, or a list of code points like the ones
+        from :func:`emoji_to_unicode`
+    :raises ValueError: if no code point is given or one is invalid
+    """
+    if isinstance(codepoints, int) or (isinstance(codepoints, str) and codepoints[:2].upper() == 'U+'):
+        codepoints = [codepoints]
+    wanted = {_codepoint(value) for value in codepoints}
+    if not wanted:
+        raise ValueError("No code point given")
+    index = _get_codepoint_index()
+    sets = sorted((index.get(codepoint, frozenset()) for codepoint in wanted), key=len)
+    return sets[0].intersection(*sets[1:])
+
+def _get_modifier_graph() -> _ModifierGraph:
+    # Groups the emoji by their sequence without modifiers and without U+FE0F, so
+    # that all qualifications of a base emoji share their variants. Of several
+    # qualifications the one with the lowest status, i.e. fully qualified, is used.
+    global _MODIFIER_GRAPH
+    if _MODIFIER_GRAPH is None:
+        groups = {}
+        for emj in EMOJI_DATA:
+            modifiers = tuple(tone or other for tone, other in _MODIFIER_REGEX.findall(emj))
+            key = _MODIFIER_REGEX.sub('', emj).replace('\ufe0f', '')
+            key = _MODIFIER_GROUPS.get(key, key)
+            groups.setdefault(key, []).append((modifiers, emj))
+        bases = {}
+        all_variants = {}
+        for key, group in groups.items():
+            plain = [emj for modifiers, emj in group if not modifiers]
+            if not key or not plain or len(plain) == len(group):
+                continue
+            base = min(plain, key=lambda emj: EMOJI_DATA[emj]['status'])
+            variants = {}
+            for modifiers, emj in sorted(group, key=lambda item: EMOJI_DATA[item[1]]['status']):
+                if modifiers:
+                    bases[emj] = base
+                    variants.setdefault(modifiers, emj)
+            variants = MappingProxyType(variants)
+            for emj in plain:
+                all_variants[emj] = variants
+        _MODIFIER_GRAPH = _ModifierGraph(bases, all_variants)
+    return _MODIFIER_GRAPH
+
+def base_of(emoji: str) -> (str | None):
+    """
+    Returns the base emoji of an emoji with skin tone, hair style or gender modifiers,
+    the emoji itself if it has no base emoji or None if it is not an emoji.
+        >>> emoji.base_of("👍🏽")
+        '👍'
+        >>> emoji.base_of("🧑🏻‍🦰")
+        '🧑'
+    """
+    if emoji not in EMOJI_DATA:
+        return None
+    return _get_modifier_graph().bases.get(emoji, emoji)
+
+def variants_of(emoji: str) -> (Mapping[Tuple[str, ...], str] | None):
+    """
+    Returns the variants of a base emoji with skin tone, hair style or gender modifiers
+    by their modifiers, or None if it is not an emoji. The mapping is read-only and
+    empty for emoji without variants, including the variants themselves.
+        >>> emoji.variants_of("👍")[("🏽",)]
+        '👍🏽'
+        >>> emoji.variants_of("🧑")[("🏻", "🦰")]
+        '🧑🏻\u200d🦰'
+    """
+    if emoji not in EMOJI_DATA:
+        return None
+    return _get_modifier_graph().variants.get(emoji, _NO_VARIANTS)
 
-def get_emoji_by_name(name: str) -> (str | None):
-    for key in KEYCHAIN:
-        KEY = EMOJI_DATA[key]
-        _name = KEY["name"]
-        if _name == f":{name}:":
-            return key
+def emoji_name(emoji: str, language: str='name') -> (str | None):
+    """
+    Returns the name of an emoji or None if it is not an emoji.
+        >>> emoji.emoji_name("👍")
+        ':thumbs_up:'
+
+    :param language: (optional) ``'name'``, a language code 'es', 'de', etc. or
+        ``'alias'`` for the first English alias, like :func:`demojize`
+    :raises ValueError: if ``language`` is unknown
+    """
+    if language != 'name' and language != 'alias' and language not in LANGUAGES:
+        raise ValueError(f"Unknown language {language!r}")
+    data = EMOJI_DATA.get(emoji)
+    if data is None:
+        return None
+    if language == 'alias':
+        return data['alias'][0] if data.get('alias') else data['en']
+    return data.get(language)
+
+def get_emoji_by_name(name: str, language: str='name') -> (str | None):
+    """
+    Returns the emoji with the name ``:name:`` or None if there is no such emoji.
+    The names are looked up in the cached dict of :func:`get_emoji_name_index`.
+        >>> emoji.get_emoji_by_name("thumbs_up")
+        '👍'
+
+    :param language: (optional) ``'name'``, a language code 'es', 'de', etc.,
+        ``'alias'`` for the English aliases or None for all of them
+    :raises ValueError: if ``language`` is unknown
+    """
+    return get_emoji_name_index(language).get(f":{name}:")
+
+def emoji_name_many(emojis: Iterable[str], language: str='name') -> List[str | None]:
+    """
+    Like :func:`emoji_name` for every emoji of an iterable.
+    """
+    return [emoji_name(emj, language) for emj in emojis]
+
+def get_emoji_by_name_many(names: Iterable[str], language: str='name') -> List[str | None]:
+    """
+    Like :func:`get_emoji_by_name` for every name of an iterable.
+        >>> emoji.get_emoji_by_name_many(["thumbs_up", "no_such_emoji"])
+        ['👍', None]
+    """
+    index = get_emoji_name_index(language)
+    return [index.get(f":{name}:") for name in names]
+
+def _get_shortcode_index(language: str) -> Tuple[List[str], List[str], List[Tuple[str, str]]]:
+    # The names of a language sorted for bisect, their emoji and all (name, emoji)
+    # pairs in the order of suggest() without weights
+    if language not in _SHORTCODE_INDEX:
+        if language == 'alias':
+            shortcodes = get_emoji_aliases_data()
+        elif language in LANGUAGES:
+            shortcodes = get_emoji_data_for_lang(language)
+        else:
+            raise ValueError(f"Unknown language {language!r}")
+        entries = sorted(shortcodes.items())
+        ranked = sorted(entries, key=lambda entry: (EMOJI_DATA[entry[1]]['index'], len(entry[0]), entry[0]))
+        _SHORTCODE_INDEX[language] = ([name for name, _ in entries], [emj for _, emj in entries], ranked)
+    return _SHORTCODE_INDEX[language]
+
+def suggest(prefix: str, language: str='en', limit: int=10,
+            weights: Mapping[str, float]=None) -> List[Tuple[str, str]]:
+    """
+    Returns the emoji whose name starts with ``prefix``, e.g. to complete a
+    name while it is typed. Each emoji is suggested once with its best name.
+        >>> emoji.suggest(":thumbs", limit=2)
+        [(':thumbs_up:', '👍'), (':thumbs_up_light_skin_tone:', '👍🏻')]
+
+    :param prefix: The start of an emoji name, with or without the leading delimiter ``:``
+    :param language: (optional) Language code 'es', 'de', etc. or 'alias' to
+        search the English names and aliases, like :func:`emojize`
+    :param limit: (optional) Maximum number of suggestions, no suggestions if it is not positive
+    :param weights: (optional) Popularity of the emoji as ``{emoji: weight}``.
+        Higher weights come first, emoji without weight count as ``0``.
+        Without weights the emoji are ordered like in :data:`EMOJI_DATA`,
+        which follows the CLDR order.
+    :returns: A list of tuples ``(name, emoji)``
+    :raises ValueError: if ``language`` is unknown
+    """
+
+    if limit <= 0:
+        return []
+    if not prefix.startswith(_DEFAULT_DELIMITER):
+        prefix = _DEFAULT_DELIMITER + prefix
+    names, emojis, ranked = _get_shortcode_index(language)
+    first = bisect_left(names, prefix)
+    last = bisect_left(names, prefix + '\U0010FFFF', first)
+
+    if weights is None and last - first > 8 * limit:
+        # Many names start with the prefix, so the first few of the
+        # ranked names that do are found quicker than all of them
+        suggestions = []
+        seen = set()
+        for name, emj in ranked:
+            if name.startswith(prefix) and emj not in seen:
+                seen.add(emj)
+                suggestions.append((name, emj))
+                if len(suggestions) == limit:
+                    break
+        return suggestions
+
+    best = {}
+    for name, emj in zip(names[first:last], emojis[first:last]):
+        rank = (EMOJI_DATA[emj]['index'], len(name), name)
+        if weights is not None:
+            rank = (-weights.get(emj, 0),) + rank
+        if emj not in best or rank < best[emj][0]:
+            best[emj] = (rank, name)
+    return [(name, emj) for emj, (_, name) in heapq.nsmallest(
+        limit, best.items(), key=lambda item: item[1][0])]
+
+def _trigrams(name: str) -> FrozenSet[str]:
+    # The trigrams of a name without delimiters, padded so that the first
+    # and last characters weigh as much as the ones in between
+    padded = '  ' + unicodedata.normalize('NFKC', name).casefold() + ' '
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+def _get_fuzzy_index(language: str) -> Tuple[List[str], List[str], List[FrozenSet[str]], Dict[str, List[int]]]:
+    # The names that emojize() knows in a language, their emoji, their trigrams
+    # and the positions of the names per trigram
+    if language not in _FUZZY_INDEX:
+        names, emojis, _ = _get_shortcode_index(language)
+        trigrams = [_trigrams(name[1:-1]) for name in names]
+        postings = {}
+        for position, name_trigrams in enumerate(trigrams):
+            for trigram in name_trigrams:
+                postings.setdefault(trigram, []).append(position)
+        _FUZZY_INDEX[language] = (names, emojis, trigrams, postings)
+    return _FUZZY_INDEX[language]
+
+def fuzzy_lookup(name: str, language: str='en', max_results: int=5) -> List[Tuple[str, str, float]]:
+    """
+    Finds the emoji whose names are most similar to a possibly misspelled name.
+    The similarity is the share of common trigrams of the two names, between
+    ``0`` and ``1`` for identical names. Each emoji is returned once with its most similar name.
+        >>> emoji.fuzzy_lookup("thumbs_pu", max_results=1)
+        [(':thumbs_up:', '👍', 0.5384615384615384)]
+
+    :param name: An emoji name, with or without the delimiters ``:``
+    :param language: (optional) Language code 'es', 'de', etc. or 'alias' to
+        search the English names and aliases, like :func:`emojize`
+    :param max_results: (optional) Maximum number of results
+    :returns: A list of tuples ``(name, emoji, similarity)``, the most similar first
+    :raises ValueError: if ``language`` is unknown
+    """
+
+    if max_results < 1:
+        return []
+    names, emojis, trigrams, postings = _get_fuzzy_index(language)
+    query = _trigrams(name.strip(_DEFAULT_DELIMITER))
+    best = {}
+    common = Counter()
+    for trigram in query:
+        common.update(postings.get(trigram, ()))
+    previous_count = None
+    for position, count in common.most_common():
+        # A name with count common trigrams has a similarity of at most count / len(query)
+        if count != previous_count and len(best) >= max_results:
+            least = heapq.nlargest(max_results, (score for score, _ in best.values()))[-1]
+            if count / len(query) < least:
+                break
+        previous_count = count
+        score = count / (len(query) + len(trigrams[position]) - count)
+        emj = emojis[position]
+        # The most similar name per emoji, the first one of equally similar names
+        if emj not in best or (score, -position) > best[emj]:
+            best[emj] = (score, -position)
+    return [(names[-position], emj, score) for emj, (score, position) in heapq.nlargest(
+        max_results, best.items(), key=lambda item: (item[1][0], -EMOJI_DATA[item[0]]['index']))]
 
 def has_zwj(text: str) -> (bool | None):
     for i in range(len(text)):
@@ -313,7 +627,9 @@ def emojize(
         variant=None,
         language='en',
         version=None,
-        handle_version=None
+        handle_version=None,
+        fuzzy=False,
+        bare_words=False
 ) -> str:
     """
     Replace emoji names in a string with Unicode codes.
@@ -328,11 +644,14 @@ def emojize(
         Python is fun ❤
         >>> print(emoji.emojize("Python is fun :red_heart:", variant="emoji_type"))
         Python is fun ❤️ # red heart, not black heart
+        >>> print(emoji.emojize("Python is fun, thumbs up", delimiters=None, bare_words=True))
+        Python is fun, 👍
 
     :param string: String contains emoji names.
     :param delimiters: (optional) Use delimiters other than _DEFAULT_DELIMITER. Each delimiter
         should contain at least one character that is not part of a-zA-Z0-9 and ``_-&.()!?#*+,``.
         See ``emoji.core._EMOJI_NAME_PATTERN`` for the regular expression of unsafe characters.
+        None for names without delimiters, see ``bare_words``.
     :param variant: (optional) Choose variation selector between "base"(None), VS-15 ("text_type") and VS-16 ("emoji_type")
     :param language: Choose language of emoji name: language code 'es', 'de', etc. or 'alias'
         to use English aliases
@@ -354,32 +673,191 @@ def emojize(
                 ...
             })
 
+    :param fuzzy: (optional) Replace an unknown name with the emoji of the most
+        similar name from :func:`fuzzy_lookup`, if they share at least half of their trigrams
+    :param bare_words: (optional) Replace names written as plain words, e.g. "red heart"
+        or "Red heart" for ``:red_heart:``, in one pass over the string with a
+        :class:`tokenizer.PhraseAutomaton`. Only whole words match and of overlapping
+        names the first and then the longest one. Names without letters like
+        ``:100:`` are not replaced. Requires ``delimiters=None`` and no ``fuzzy``.
     :raises ValueError: if ``variant`` is neither None, 'text_type' or 'emoji_type'
+        or ``delimiters`` and ``bare_words`` do not fit together
 
     """
 
-    if language == 'alias':
-        language_pack = get_emoji_aliases_data()
-    else:
-        language_pack = get_emoji_data_for_lang(language)
+    return _get_emojizer(delimiters, variant, language, version, handle_version, fuzzy, bare_words)(string)
 
-    pattern = re.compile('(%s[%s]+%s)' %
-                         (re.escape(delimiters[0]), _EMOJI_NAME_PATTERN, re.escape(delimiters[1])))
+class Emojizer:
+    """
+    Replaces emoji names in strings like :func:`emojize`. The language pack,
+    the pattern and the replace function are set up once when it is created.
+        >>> emojizer = emoji.Emojizer(language='alias')
+        >>> emojizer("Python is fun :thumbsup:")
+        'Python is fun 👍'
+
+    :param known_names: (optional) If True, the pattern only matches the names of the
+        language and names with non-ASCII characters, so that text like ``12:30:45``
+        is skipped by the regex engine. The result is the same. Compiling this pattern
+        takes most of a second and matching the names with it is slower, so it only
+        pays off for large amounts of text that are mostly short unknown names like
+        ``host:8080:``, and even then by about a tenth. Requires delimiters without
+        name characters and no ``fuzzy``.
+    :raises ValueError: if ``known_names`` is True but not possible with the settings
+
+    See :func:`emojize` for the other parameters.
+    """
+
+    __slots__ = ('delimiters', 'variant', 'language', 'version', 'handle_version', 'fuzzy',
+                 'bare_words', 'known_names', '_pattern', '_replace', '_words')
+
+    def __init__(
+            self,
+            delimiters=(_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+            variant=None,
+            language='en',
+            version=None,
+            handle_version=None,
+            fuzzy=False,
+            bare_words=False,
+            known_names=False):
+        if bare_words:
+            if delimiters is not None or fuzzy or known_names:
+                raise ValueError(
+                    "Parameter 'bare_words' requires delimiters=None, fuzzy=False and known_names=False")
+        elif delimiters is None:
+            raise ValueError("Parameter 'delimiters' can only be None with bare_words=True")
+        elif known_names and (fuzzy or not all(delimiters) or
+                              re.search('[%s]' % _EMOJI_NAME_PATTERN, ''.join(delimiters)) is not None):
+            raise ValueError(
+                "Parameter 'known_names' requires delimiters without name characters and fuzzy=False")
+        self.delimiters = delimiters
+        self.variant = variant
+        self.language = language
+        self.version = version
+        self.handle_version = handle_version
+        self.fuzzy = fuzzy
+        self.bare_words = bare_words
+        self.known_names = known_names
+        if bare_words:
+            self._pattern = self._replace = None
+            self._words = _get_word_automaton(language) + (_emojize_converter(variant, version, handle_version),)
+        else:
+            self._pattern, self._replace = _emojize_replacer(
+                delimiters, variant, language, version, handle_version, fuzzy, known_names)
+            self._words = None
+
+    def emojize(self, string: str) -> str:
+        if self._words is not None:
+            return self._emojize_words(string)
+        return self._pattern.sub(self._replace, string)
+
+    __call__ = emojize
+
+    def _emojize_words(self, string: str) -> str:
+        automaton, emojis, convert = self._words
+        pieces = []
+        last = 0
+        for start, end, phrase in automaton.finditer(string):
+            pieces.append(string[last:start])
+            pieces.append(convert(emojis[phrase], start, end))
+            last = end
+        pieces.append(string[last:])
+        return ''.join(pieces)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(delimiters={self.delimiters!r}, variant={self.variant!r}, ' \
+            f'language={self.language!r}, version={self.version!r}, ' \
+            f'handle_version={self.handle_version!r}, fuzzy={self.fuzzy!r}, ' \
+            f'bare_words={self.bare_words!r}, known_names={self.known_names!r})'
+
+def _get_emojizer(delimiters, variant, language, version, handle_version, fuzzy=False, bare_words=False) -> Emojizer:
+    # The Emojizer for the settings from the cache of the recently used ones
+    try:
+        key = (None if delimiters is None else tuple(delimiters),
+               variant, language, version, handle_version, fuzzy, bare_words)
+        emojizer = _EMOJIZERS.pop(key, None)
+    except TypeError:
+        # Unhashable settings, e.g. a handle_version object without __hash__
+        return Emojizer(delimiters, variant, language, version, handle_version, fuzzy, bare_words)
+    if emojizer is None:
+        emojizer = Emojizer(delimiters, variant, language, version, handle_version, fuzzy, bare_words)
+        if len(_EMOJIZERS) >= _EMOJIZERS_SIZE:
+            _EMOJIZERS.pop(next(iter(_EMOJIZERS)), None)
+    _EMOJIZERS[key] = emojizer
+    return emojizer
+
+def _get_word_automaton(language: str) -> Tuple[PhraseAutomaton, Tuple[str, ...]]:
+    # The names of a language without delimiters as the phrases of an automaton
+    # and their emoji. Names without letters like :100: are left out.
+    if language not in _WORD_AUTOMATA:
+        pack = get_emoji_aliases_data() if language == 'alias' else get_emoji_data_for_lang(language)
+        names = [(name[1:-1], emj) for name, emj in pack.items() if any(char.isalpha() for char in name)]
+        _WORD_AUTOMATA[language] = (PhraseAutomaton(name for name, _ in names), tuple(emj for _, emj in names))
+    return _WORD_AUTOMATA[language]
+
+def _get_shortcode_pattern(language: str) -> str:
+    # The names of a language that the emojize() pattern can match as one pattern
+    # that is factored by characters like get_emoji_regex()
+    if language not in _SHORTCODE_PATTERNS:
+        name_regex = re.compile('[%s]+' % _EMOJI_NAME_PATTERN)
+        _SHORTCODE_PATTERNS[language] = get_trie_pattern(
+            name for name in get_emoji_shortcode_table(language) if name_regex.fullmatch(name))
+    return _SHORTCODE_PATTERNS[language]
+
+def _emojize_pattern(delimiters, language, known_names) -> 're.Pattern[str]':
+    # A name is the longest run of name characters between the delimiters, which
+    # are not name characters themselves if known_names is set. With known_names
+    # the pattern does not match unknown ASCII names, unless the closing delimiter
+    # could start another name: the pattern without known_names consumes the
+    # delimiter, so that name must not be replaced. Non-ASCII names are matched
+    # for the NFKC normalization in replace().
+    name = '[%s]+' % _EMOJI_NAME_PATTERN
+    opening, closing = map(re.escape, delimiters)
+    if not known_names:
+        return re.compile('%s(%s)%s' % (opening, name, closing))
+    ascii_name = '[%s]' % ''.join(re.escape(chr(i)) for i in range(128) if re.match(name, chr(i)))
+    alternatives = [
+        _get_shortcode_pattern(language),
+        '%s*(?![\\x00-\\x7f])%s' % (ascii_name, name)]
+    overlaps = [re.escape(delimiters[0][size:])
+                for size in range(1, min(map(len, delimiters)) + 1)
+                if delimiters[1][-size:] == delimiters[0][:size]]
+    if overlaps:
+        alternatives.append('%s+(?=%s(?:%s)%s%s)' % (ascii_name, closing, '|'.join(overlaps), name, closing))
+    return re.compile('%s(%s)%s' % (opening, '|'.join(alternatives), closing))
+
+def _emojize_replacer(delimiters, variant, language, version, handle_version, fuzzy=False, known_names=False):
+    # Resolves the language pack and compiles the pattern and the replace
+    # function of emojize() once for any number of strings.
+    shortcodes = get_emoji_shortcode_table(language)
+    pattern = _emojize_pattern(delimiters, language, known_names)
 
     def replace(match):
-        name = match.group(1)[len(delimiters[0]):-len(delimiters[1])]
-        emj = language_pack.get(
-            _DEFAULT_DELIMITER +
-            unicodedata.normalize('NFKC', name) +
-            _DEFAULT_DELIMITER)
+        name = match.group(1)
+        # The NFKC normalization of ASCII names is the name itself
+        emj = shortcodes.get(name if name.isascii() else unicodedata.normalize('NFKC', name))
+        if emj is None and fuzzy:
+            similar = fuzzy_lookup(name, language, 1)
+            if similar and similar[0][2] >= _FUZZY_MIN_SIMILARITY:
+                emj = similar[0][1]
         if emj is None:
-            return match.group(1)
+            return match.group(0)
+        if version is None and variant is None:
+            return emj
+        return convert(emj, match.start(), match.end())
 
+    convert = _emojize_converter(variant, version, handle_version)
+    return pattern, replace
+
+def _emojize_converter(variant, version, handle_version):
+    # The part of the replace function of emojize() after the emoji of a name is
+    # found, for the names between delimiters and for the bare words
+    def convert(emj, start, end):
         if version is not None and EMOJI_DATA[emj]['E'] > version:
             if callable(handle_version):
                 emj_data = EMOJI_DATA[emj].copy()
-                emj_data['match_start'] = match.start()
-                emj_data['match_end'] = match.end()
+                emj_data['match_start'] = start
+                emj_data['match_end'] = end
                 return handle_version(emj, emj_data)
 
             elif handle_version is not None:
@@ -401,9 +879,9 @@ def emojize(
             raise ValueError(
                 "Parameter 'variant' must be either None, 'text_type' or 'emoji_type'")
 
-    return pattern.sub(replace, string)
+    return convert
 
-def analyze(string: str, non_emoji: bool = False, join_emoji: bool = True) -> Iterator[Token]:
+def analyze(string: str, non_emoji: bool = False, join_emoji: bool = True, spans: bool = False) -> Iterator[Token]:
     """
     Find unicode emoji in a string. Yield each emoji as a named tuple
     :class:`Token` ``(chars, EmojiMatch)`` or `:class:`Token` ``(chars, EmojiMatchZWJNonRGI)``.
@@ -414,10 +892,16 @@ def analyze(string: str, non_emoji: bool = False, join_emoji: bool = True) -> It
     :param non_emoji: If True also yield all non-emoji characters as Token(char, char)
     :param join_emoji: If True, multiple EmojiMatch are merged into a single
         EmojiMatchZWJNonRGI if they are separated only by a ZWJ.
+    :param spans: (optional) If True and ``non_emoji`` is True, yield each run of
+        non-emoji characters between two emoji as a single Token(text, text)
     """
 
+    if non_emoji and spans:
+        return filter_tokens(
+            tokenize_spans(string, keep_zwj=True), emoji_only=False, join_emoji=join_emoji)
+
     return filter_tokens(
-        tokenize(string, keep_zwj=True), emoji_only=not non_emoji, join_emoji=join_emoji)
+        tokenize(string, keep_zwj=True, backend=config.tokenize_backend), emoji_only=not non_emoji, join_emoji=join_emoji)
 
 def demojize(
         string,
@@ -437,6 +921,8 @@ def demojize(
         Unicode is tricky __hushed_face__
 
     :param string: String contains Unicode characters. MUST BE UNICODE.
+        Can also be UTF-8 encoded ``bytes``, ``memoryview`` or ``mmap.mmap``,
+        then the result is UTF-8 encoded ``bytes`` as well.
     :param delimiters: (optional) User delimiters other than ``_DEFAULT_DELIMITER``
     :param language: Choose language of emoji name: language code 'es', 'de', etc. or 'alias'
         to use English aliases
@@ -461,13 +947,15 @@ def demojize(
 
     """
 
-    if language == 'alias':
-        language = 'en'
-        _use_aliases = True
-    else:
-        _use_aliases = False
+    return _demojize_string(string, _demojize_handler(
+        delimiters, language, version, handle_version), config.demojize_keep_zwj)
+
+def _demojize_handler(delimiters, language, version, handle_version):
+    # Returns the function that demojize() uses to replace each emoji match
+    table = None
 
     def handle(emoji_match):
+        nonlocal table
         if version is not None and emoji_match.data['E'] > version:
             if callable(handle_version):
                 return handle_version(emoji_match.emoji, emoji_match.data_copy())
@@ -475,16 +963,54 @@ def demojize(
                 return handle_version
             else:
                 return ''
-        elif language in emoji_match.data:
-            if _use_aliases and 'alias' in emoji_match.data:
-                return delimiters[0] + emoji_match.data['alias'][0][1:-1] + delimiters[1]
+        if table is None:
+            table = _get_demojize_table(delimiters, language)
+        emj = emoji_match.emoji
+        # The emoji exists, but if it is not translated, we keep the emoji
+        return table.get(emj, emj)
+
+    return handle
+
+def _get_demojize_table(delimiters, language) -> Dict[str, str]:
+    # The table of the output of demojize() per emoji for the settings from the
+    # cache of the recently used ones
+    try:
+        key = (tuple(delimiters), language)
+        table = _DEMOJIZE_TABLES.pop(key, None)
+    except TypeError:
+        # Unhashable delimiters
+        return _demojize_table(delimiters, language)
+    if table is None:
+        table = _demojize_table(delimiters, language)
+        if len(_DEMOJIZE_TABLES) >= _DEMOJIZE_TABLES_SIZE:
+            _DEMOJIZE_TABLES.pop(next(iter(_DEMOJIZE_TABLES)), None)
+    _DEMOJIZE_TABLES[key] = table
+    return table
+
+def _demojize_table(delimiters, language) -> Dict[str, str]:
+    # {emoji: delimiters[0] + name + delimiters[1]} of the emoji with a name in the language
+    if language == 'alias':
+        language = 'en'
+        _use_aliases = True
+    else:
+        _use_aliases = False
+    start, end = delimiters[0], delimiters[1]
+    table = {}
+    for emj, data in EMOJI_DATA.items():
+        if language in data:
+            if _use_aliases and data.get('alias'):
+                table[emj] = start + data['alias'][0][1:-1] + end
             else:
-                return delimiters[0] + emoji_match.data[language][1:-1] + delimiters[1]
-        else:
-            # The emoji exists, but it is not translated, so we keep the emoji
-            return emoji_match.emoji
+                table[emj] = start + data[language][1:-1] + end
+    return table
+
+def _demojize_string(string, handle, keep_zwj):
+    if not isinstance(string, str):
+        return _join_utf8(tokenize_bytes(string, keep_zwj=keep_zwj), handle)
+    if not _may_contain_emoji(string):
+        return _strip_variation_selectors(string)
 
-    matches = tokenize(string, keep_zwj=config.demojize_keep_zwj)
+    matches = tokenize_spans(string, keep_zwj=keep_zwj)
     return "".join(str(handle(token.value)) if isinstance(
         token.value, EmojiMatch) else token.value for token in matches)
 
@@ -493,6 +1019,8 @@ def replace_emoji(string: str, replace: str='', version: int=-1):
     Replace Unicode emoji in a customizable string.
 
     :param string: String contains Unicode characters. MUST BE UNICODE.
+        Can also be UTF-8 encoded ``bytes``, ``memoryview`` or ``mmap.mmap``,
+        then the result is UTF-8 encoded ``bytes`` as well.
     :param replace: (optional) replace can be either a string or a callable;
         If it is a callable, it's passed the Unicode emoji and the data dict from
         :data:`EMOJI_DATA` and must return a replacement string to be used.
@@ -514,13 +1042,26 @@ def replace_emoji(string: str, replace: str='', version: int=-1):
             return replace
         return emoji_match.emoji
 
-    matches = tokenize(string, keep_zwj=config.replace_emoji_keep_zwj)
+    if not isinstance(string, str):
+        if config.replace_emoji_keep_zwj:
+            # filter_tokens() joins the emoji around the ZWJs as str
+            return replace_emoji(bytes(string).decode('utf-8'), replace, version).encode('utf-8')
+        return _join_utf8(tokenize_bytes(string, keep_zwj=False), handle)
+    if not _may_contain_emoji(string):
+        return _strip_variation_selectors(string)
+
+    matches = tokenize_spans(string, keep_zwj=config.replace_emoji_keep_zwj)
     if config.replace_emoji_keep_zwj:
         matches = filter_tokens(
             matches, emoji_only=False, join_emoji=True)
     return "".join(str(handle(m.value)) if isinstance(
         m.value, EmojiMatch) else m.value for m in matches)
 
+def _join_utf8(matches: Iterable[Token], handle: Callable[[EmojiMatch], str]) -> bytes:
+    # Joins the tokens of tokenize_bytes() with the UTF-8 encoded replacements of the emoji
+    return b"".join(str(handle(m.value)).encode('utf-8') if isinstance(
+        m.value, EmojiMatch) else m.value for m in matches)
+
 def emoji_list(string: str):
     """
     Returns the location and emoji in list of dict format.
@@ -528,11 +1069,25 @@ def emoji_list(string: str):
         [{'match_start': 15, 'match_end': 16, 'emoji': '😁'}]
     """
 
+    if not _may_contain_emoji(string):
+        return []
+
+    emojis = get_automaton().emojis
     return [{
-        'match_start': m.value.start,
-        'match_end': m.value.end,
-        'emoji': m.value.emoji,
-    } for m in tokenize(string, keep_zwj=False) if isinstance(m.value, EmojiMatch)]
+        'match_start': start,
+        'match_end': end,
+        'emoji': emojis[index],
+    } for start, end, index in iter_matches(string, keep_zwj=False)]
+
+def emoji_matches(string: str) -> EmojiMatches:
+    """
+    Returns the same matches as :func:`emoji_list` as :class:`EmojiMatches`, which
+    stores them in three ``array('I')`` instead of a dict per match.
+        >>> emoji.emoji_matches("Hi, I am fine. 😁").to_list()
+        [{'match_start': 15, 'match_end': 16, 'emoji': '😁'}]
+    """
+
+    return EmojiMatches(string)
 
 def distinct_emoji_list(string: str):
     """Returns distinct list of emojis from the string."""
@@ -547,9 +1102,120 @@ def emoji_count(string: str, unique=False):
 
     :param unique: (optional) True if count only unique emojis
     """
+    if not _may_contain_emoji(string):
+        return 0
     if unique:
-        return len(distinct_emoji_list(string))
-    return len(emoji_list(string))
+        return len({index for _, _, index in iter_matches(string, keep_zwj=False)})
+    return sum(1 for _ in iter_matches(string, keep_zwj=False))
+
+def emojize_many(
+        strings: Iterable[str],
+        delimiters=(_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+        variant=None,
+        language='en',
+        version=None,
+        handle_version=None,
+        workers: int=None,
+        chunksize: int=1000
+) -> Iterator[str]:
+    """
+    Like :func:`emojize` for every string of an iterable. The language pack,
+    the pattern and the replace function are only set up once for all strings.
+        >>> list(emoji.emojize_many(["Python is fun :thumbs_up:", "No emoji"]))
+        ['Python is fun 👍', 'No emoji']
+
+    :param strings: An iterable of strings that contain emoji names
+    :param workers: (optional) Number of processes. If set, the strings are
+        sent to a process pool in chunks of ``chunksize`` strings. A callable
+        ``handle_version`` must then be picklable, e.g. a module level function.
+    :param chunksize: (optional) Number of strings per chunk for the process pool
+    :returns: An iterator over the results in the same order as ``strings``
+
+    See :func:`emojize` for the other parameters.
+    """
+
+    return _map_many(_emojize_iter, strings, workers, chunksize,
+                     delimiters, variant, language, version, handle_version)
+
+def _emojize_iter(strings, delimiters, variant, language, version, handle_version) -> Iterator[str]:
+    emojizer = _get_emojizer(delimiters, variant, language, version, handle_version)
+    for string in strings:
+        yield emojizer(string)
+
+def demojize_many(
+        strings: Iterable[str],
+        delimiters=(_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+        language='en',
+        version=None,
+        handle_version=None,
+        workers: int=None,
+        chunksize: int=1000
+) -> Iterator[str]:
+    """
+    Like :func:`demojize` for every string of an iterable. The replace
+    function and the language are only set up once for all strings.
+        >>> list(emoji.demojize_many(["Python is fun 👍", "No emoji"]))
+        ['Python is fun :thumbs_up:', 'No emoji']
+
+    :param strings: An iterable of strings that contain Unicode characters. MUST BE UNICODE.
+    :param workers: (optional) Number of processes. If set, the strings are
+        sent to a process pool in chunks of ``chunksize`` strings. A callable
+        ``handle_version`` must then be picklable, e.g. a module level function.
+    :param chunksize: (optional) Number of strings per chunk for the process pool
+    :returns: An iterator over the results in the same order as ``strings``
+
+    See :func:`demojize` for the other parameters.
+    """
+
+    return _map_many(_demojize_iter, strings, workers, chunksize,
+                     delimiters, language, version, handle_version, config.demojize_keep_zwj)
+
+def _demojize_iter(strings, delimiters, language, version, handle_version, keep_zwj) -> Iterator[str]:
+    handle = _demojize_handler(delimiters, language, version, handle_version)
+    for string in strings:
+        yield _demojize_string(string, handle, keep_zwj)
+
+def emoji_list_many(strings: Iterable[str], workers: int=None, chunksize: int=1000) -> Iterator[List[Dict]]:
+    """
+    Like :func:`emoji_list` for every string of an iterable.
+        >>> list(emoji.emoji_list_many(["Hi, I am fine. 😁", "No emoji"]))
+        [[{'match_start': 15, 'match_end': 16, 'emoji': '😁'}], []]
+
+    :param strings: An iterable of strings that contain Unicode characters. MUST BE UNICODE.
+    :param workers: (optional) Number of processes. If set, the strings are
+        sent to a process pool in chunks of ``chunksize`` strings.
+    :param chunksize: (optional) Number of strings per chunk for the process pool
+    :returns: An iterator over the results in the same order as ``strings``
+    """
+
+    return _map_many(_emoji_list_iter, strings, workers, chunksize)
+
+def _emoji_list_iter(strings) -> Iterator[List[Dict]]:
+    for string in strings:
+        yield emoji_list(string)
+
+def _map_many(func: Callable, strings: Iterable[str], workers: int, chunksize: int, *args) -> Iterator:
+    # Yields from func(strings, *args), either directly or from a process
+    # pool that runs it on consecutive chunks of strings, in order
+    if not workers:
+        yield from func(strings, *args)
+        return
+
+    strings = iter(strings)
+    chunks = iter(lambda: list(islice(strings, chunksize)), [])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Only keep a few chunks per worker in flight, so the strings are
+        # still read lazily
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_run_chunk, func, chunk, *args))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def _run_chunk(func: Callable, chunk: List[str], *args) -> List:
+    return list(func(chunk, *args))
 
 def is_emoji(string: str):
     """
@@ -558,13 +1224,38 @@ def is_emoji(string: str):
     """
     return string in EMOJI_DATA
 
+def has_emoji(string: str) -> bool:
+    """
+    Returns True if the string contains at least one emoji.
+    Unlike :func:`emoji_count` it stops at the first emoji and most strings
+    without emoji are rejected without tokenizing them.
+        >>> emoji.has_emoji("Hi, I am fine. 😁")
+        True
+        >>> emoji.has_emoji("Hi, I am fine.")
+        False
+    """
+    if not _may_contain_emoji(string):
+        return False
+    return next(iter_matches(string, keep_zwj=False), None) is not None
+
+def _may_contain_emoji(string: str) -> bool:
+    # No emoji consists only of ASCII characters and every emoji starts
+    # with one of the characters from get_emoji_start_chars()
+    return not string.isascii() and not get_emoji_start_chars().isdisjoint(string)
+
+def _strip_variation_selectors(string: str) -> str:
+    # tokenize() drops the variation selectors that are not part of an emoji
+    if '\uFE0E' in string or '\uFE0F' in string:
+        return string.replace('\uFE0E', '').replace('\uFE0F', '')
+    return string
+
 def purely_emoji(string: str) -> bool:
     """
     Returns True if the string contains only emojis.
     This might not imply that `is_emoji` for all the characters, for example,
     if the string contains variation selectors.
     """
-    return all(isinstance(m.value, EmojiMatch) for m in analyze(string, non_emoji=True))
+    return all(isinstance(m.value, EmojiMatch) for m in analyze(string, non_emoji=True, spans=True))
 
 def version(string: str):
     """
@@ -593,37 +1284,70 @@ def version(string: str):
     version = []
 
     def f(e, emoji_data):
-        version.append(emoji_data['R'])
+        version.append(emoji_data['E'])
         return ''
     replace_emoji(string, replace=f, version=-1)
     if version:
         return version[0]
-    emojize(string, language='alias', version=-1, handle_version=f)
-    if version:
-        return version[0]
-    for lang_code in _EMOJI_LANG_CACHE:
-        emojize(string, language=lang_code, version=-1, handle_version=f)
-        if version:
-            return version[0]
+
+    # Try to find the first emoji name. emojize() with the default settings reuses
+    # the cached Emojizer, any emoji in its result comes from a name.
+    for lang_code in ('alias', *_EMOJI_LANG_CACHE):
+        for token in analyze(emojize(string, language=lang_code)):
+            if token.value.data is not None:
+                return token.value.data['E']
 
     raise ValueError("No emoji found in string")
 
+def _get_version_index() -> Tuple[List[float], Tuple[str, ...]]:
+    # All emoji sorted by their Emoji Version and then by their order in
+    # EMOJI_DATA, with the list of their versions for bisect
+    global _VERSION_INDEX
+    if _VERSION_INDEX is None:
+        emojis = tuple(sorted(EMOJI_DATA, key=lambda emj: EMOJI_DATA[emj]['E']))
+        _VERSION_INDEX = ([EMOJI_DATA[emj]['E'] for emj in emojis], emojis)
+    return _VERSION_INDEX
+
+def emojis_up_to_version(version: float) -> Tuple[str, ...]:
+    """
+    Returns all emoji with an Emoji Version up to and including ``version``,
+    sorted by their version.
+        >>> emoji.emojis_up_to_version(0.6)[:3]
+        ('😃', '😄', '😁')
+    """
+    versions, emojis = _get_version_index()
+    return emojis[:bisect_right(versions, version)]
+
+def emojis_in_version_range(first: float, last: float) -> Tuple[str, ...]:
+    """
+    Returns all emoji with an Emoji Version from ``first`` up to and including
+    ``last``, sorted by their version.
+        >>> emoji.emojis_in_version_range(15, 15)[:3]
+        ('🫨', '🩷', '🩵')
+    """
+    versions, emojis = _get_version_index()
+    return emojis[bisect_left(versions, first):bisect_right(versions, last)]
+
+def allowed_set(version: float) -> FrozenSet[str]:
+    """
+    Returns the set of all emoji with an Emoji Version up to and including
+    ``version``, e.g. the emoji that a client with that version can show.
+    The set is only built once per distinct set of emoji and then cached.
+        >>> "🫨" in emoji.allowed_set(14)
+        False
+    """
+    versions, emojis = _get_version_index()
+    count = bisect_right(versions, version)
+    if count not in _ALLOWED_SETS:
+        _ALLOWED_SETS[count] = frozenset(emojis[:count])
+    return _ALLOWED_SETS[count]
+
 def has_alias(emoji: str) -> (bool | None):
     if is_emoji(emoji):
-        for key in KEYCHAIN:
-            KEY = EMOJI_DATA[key]
-            if KEY["emoji"] == emoji:
-                if KEY["alias"][0] != KEY["name"]:
-                    return True
-                return False
+        return emoji in _get_variant_sets().aliased
     return None
 
 def alias(emoji: str):
-    if is_emoji(emoji):
-        for key in KEYCHAIN: 
-            KEY = EMOJI_DATA[key]
-            if KEY["emoji"] == emoji:
-                if has_alias(KEY["emoji"]):
-                    return KEY["alias"]
-                return None
+    if emoji in _get_variant_sets().aliased:
+        return EMOJI_DATA[emoji]["alias"]
     return None            
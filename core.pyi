@@ -1,11 +1,13 @@
 from collections.abc import Callable
 from typing_extensions import Literal, TypedDict
-from typing import Iterator, Dict, List, Any
-from .tokenizer import Token
+from mmap import mmap
+from typing import Iterable, Iterator, Dict, List, Any, Mapping, overload
+from .tokenizer import Token, EmojiMatches as EmojiMatches, get_emoji_regex as get_emoji_regex
 
 class config:
     demojize_keep_zwj: bool
     replace_emoji_keep_zwj: bool
+    tokenize_backend: Literal["tree", "automaton", "regex"]
 
 class _EmojiListReturn(TypedDict):
     emoji: str
@@ -14,7 +16,11 @@ class _EmojiListReturn(TypedDict):
 
 def category_exists(category: str = ..., category_id: int = ...) -> bool: ...
 
-def category(emoji: str) -> (Dict[str, int] | List[Dict[str, int]] | None): ...
+def category(emoji: str) -> (Mapping[str, Any] | None): ...
+
+def category_of_many(emojis: Iterable[str]) -> List[Mapping[str, Any] | None]: ...
+
+def categorize_text(text: str) -> List[Mapping[str, Any]]: ...
 
 def get_all_categories() -> Dict[Dict[str, int]]: ...
 
@@ -54,20 +60,55 @@ def is_emoji_variation(emoji: str) -> (bool | None): ...
 def get_all_emoji_variants() -> List[Dict[str, Any]]: ...
 
 def emoji_to_unicode(emoji: str | List[str]) -> (str | List[str]): ...
-
-def emoji_name(emoji: str) -> (str | None): ... 
-def get_emoji_by_name(name: str) -> (str | None): ...
+def emojis_containing(codepoints: int | str | Iterable[int | str]) -> frozenset[str]: ...
+def base_of(emoji: str) -> (str | None): ...
+def variants_of(emoji: str) -> (Mapping[tuple[str, ...], str] | None): ...
+
+def emoji_name(emoji: str, language: str = ...) -> (str | None): ...
+def get_emoji_by_name(name: str, language: str | None = ...) -> (str | None): ...
+def emoji_name_many(emojis: Iterable[str], language: str = ...) -> List[str | None]: ...
+def get_emoji_by_name_many(names: Iterable[str], language: str | None = ...) -> List[str | None]: ...
+def suggest(prefix: str, language: str = ..., limit: int = ...,
+            weights: Mapping[str, float] | None = ...) -> List[tuple[str, str]]: ...
+def fuzzy_lookup(name: str, language: str = ...,
+                 max_results: int = ...) -> List[tuple[str, str, float]]: ...
 def has_zwj(text: str) -> (bool | None): ...
 
 def emojize(
     string: str,
-    delimiters: tuple[str, str] = ...,
+    delimiters: tuple[str, str] | None = ...,
     variant: Literal["text_type", "emoji_type", None] = ...,
     language: str = ...,
     version: float | None = ...,
     handle_version: str | Callable[[str, dict[str, str]], str] | None = ...,
+    fuzzy: bool = ...,
+    bare_words: bool = ...,
 ) -> str: ...
 
+class Emojizer:
+    delimiters: tuple[str, str] | None
+    variant: Literal["text_type", "emoji_type", None]
+    language: str
+    version: float | None
+    handle_version: str | Callable[[str, dict[str, str]], str] | None
+    fuzzy: bool
+    bare_words: bool
+    known_names: bool
+    def __init__(
+        self,
+        delimiters: tuple[str, str] | None = ...,
+        variant: Literal["text_type", "emoji_type", None] = ...,
+        language: str = ...,
+        version: float | None = ...,
+        handle_version: str | Callable[[str, dict[str, str]], str] | None = ...,
+        fuzzy: bool = ...,
+        bare_words: bool = ...,
+        known_names: bool = ...,
+    ) -> None: ...
+    def emojize(self, string: str) -> str: ...
+    def __call__(self, string: str) -> str: ...
+
+@overload
 def demojize(
     string: str,
     delimiters: tuple[str, str] = ...,
@@ -75,16 +116,58 @@ def demojize(
     version: float | None = ...,
     handle_version: str | Callable[[str, dict[str, str]], str] | None = ...,
 ) -> str: ...
+@overload
+def demojize(
+    string: bytes | bytearray | memoryview | mmap,
+    delimiters: tuple[str, str] = ...,
+    language: str = ...,
+    version: float | None = ...,
+    handle_version: str | Callable[[str, dict[str, str]], str] | None = ...,
+) -> bytes: ...
 
-def analyze(string: str, non_emoji: bool,
-            join_emoji: bool) -> Iterator[Token]: ...
+def analyze(string: str, non_emoji: bool = ...,
+            join_emoji: bool = ..., spans: bool = ...) -> Iterator[Token]: ...
 
+@overload
 def replace_emoji(string: str, replace: str | Callable[[
                   str, dict[str, str]], str] = ..., version: float 
                   = ...) -> str: ...
+@overload
+def replace_emoji(string: bytes | bytearray | memoryview | mmap, replace: str | Callable[[
+                  str, dict[str, str]], str] = ..., version: float
+                  = ...) -> bytes: ...
+
+def emojize_many(
+    strings: Iterable[str],
+    delimiters: tuple[str, str] = ...,
+    variant: Literal["text_type", "emoji_type", None] = ...,
+    language: str = ...,
+    version: float | None = ...,
+    handle_version: str | Callable[[str, dict[str, str]], str] | None = ...,
+    workers: int | None = ...,
+    chunksize: int = ...,
+) -> Iterator[str]: ...
+
+def demojize_many(
+    strings: Iterable[str],
+    delimiters: tuple[str, str] = ...,
+    language: str = ...,
+    version: float | None = ...,
+    handle_version: str | Callable[[str, dict[str, str]], str] | None = ...,
+    workers: int | None = ...,
+    chunksize: int = ...,
+) -> Iterator[str]: ...
+
+def emoji_list_many(strings: Iterable[str], workers: int | None = ...,
+                    chunksize: int = ...) -> Iterator[list[_EmojiListReturn]]: ...
 
 def emoji_list(string: str) -> list[_EmojiListReturn]: ...
+def emoji_matches(string: str) -> EmojiMatches: ...
 def distinct_emoji_list(string: str) -> list[str]: ...
 def emoji_count(string: str, unique: bool = ...) -> int: ...
 def version(string: str) -> float: ...
+def emojis_up_to_version(version: float) -> tuple[str, ...]: ...
+def emojis_in_version_range(first: float, last: float) -> tuple[str, ...]: ...
+def allowed_set(version: float) -> frozenset[str]: ...
 def is_emoji(string: str) -> bool: ...
+def has_emoji(string: str) -> bool: ...
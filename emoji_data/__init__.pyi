@@ -9,6 +9,8 @@ def get_aliases_unicode_dict() -> Dict[str, str]: ...
 
 def get_emoji_data_for_lang(lang: str) -> Dict: ...
 def get_emoji_aliases_data() -> Dict: ...
+def get_emoji_shortcode_table(lang: str) -> Dict[str, str]: ...
+def get_emoji_name_index(column: str | None) -> Dict[str, str]: ...
 def get_categories_data() -> Dict[Dict[str, int]]: ...
 def categories_key_chain() -> Dict[Dict[str, int]]: ...
 def emoji_data() -> Dict[Dict[str, int, Any]]: ...
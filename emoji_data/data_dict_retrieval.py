@@ -1,8 +1,10 @@
+import unicodedata
 from data_dict import CATEGORIES, EMOJI_DATA, BASIC_EMOJIS, LANGUAGES, STATUS
 from typing import Dict, List, Any
 
 __all__ = [
-    "get_emoji_data_for_lang", "get_emoji_aliases_data", "get_categories_data",
+    "get_emoji_data_for_lang", "get_emoji_aliases_data", "get_emoji_shortcode_table",
+    "get_emoji_name_index", "get_categories_data",
     "categories_key_chain", "emoji_data", "key_chain", "EMOJI_DATA", "STATUS", 
     "LANGUAGES", "CATEGORIES", "BASIC_EMOJIS"
 ]
@@ -11,6 +13,10 @@ _EMOJI_LANG_CACHE = {lang: None for lang in LANGUAGES}  # Cache for the language
 
 _EMOJI_ALIASES_CACHE = {}  # Cache for the aliases dict
 
+_EMOJI_SHORTCODE_CACHE = {}  # Cache for the shortcode dicts per language
+
+_EMOJI_NAME_INDEX = {}  # Cache for the name dicts per column
+
 def get_emoji_data_for_lang(lang) -> Dict:
     """Generate dict containing all fully-qualified and component emoji name for a language
     The dict is only generated once per language and then cached in _EMOJI_LANG_CACHE[lang]"""
@@ -28,12 +34,48 @@ def get_emoji_aliases_data() -> Dict:
     if not _EMOJI_ALIASES_CACHE:
         _EMOJI_ALIASES_CACHE.update(get_emoji_data_for_lang('en'))
         for emj, data in EMOJI_DATA.items():
-            if 'alias' in data and data['status'] <= STATUS['fully_qualified']:
+            if data.get('alias') and data['status'] <= STATUS['fully_qualified']:
                 for alias in data['alias']:
                     _EMOJI_ALIASES_CACHE[alias] = emj
 
     return _EMOJI_ALIASES_CACHE
 
+def get_emoji_shortcode_table(lang) -> Dict:
+    """Generate dict like get_emoji_data_for_lang() or for 'alias' like get_emoji_aliases_data(),
+    but keyed by the NFKC normalized names without the delimiters ':'
+    The dict is only generated once per language and then cached in _EMOJI_SHORTCODE_CACHE[lang]"""
+
+    if lang not in _EMOJI_SHORTCODE_CACHE:
+        pack = get_emoji_aliases_data() if lang == 'alias' else get_emoji_data_for_lang(lang)
+        _EMOJI_SHORTCODE_CACHE[lang] = {unicodedata.normalize('NFKC', name[1:-1]): emj
+                                        for name, emj in pack.items()}
+
+    return _EMOJI_SHORTCODE_CACHE[lang]
+
+def get_emoji_name_index(column) -> Dict:
+    """Generate dict containing the emoji for every name in a column of EMOJI_DATA:
+    'name', a language code, 'alias' or None for all of them. Unlike get_emoji_data_for_lang()
+    it contains the emoji of every status, if several emoji have the same name the first
+    one in EMOJI_DATA wins. With None a 'name' wins over a language and a language over an alias.
+    The dict is only generated once per column and then cached in _EMOJI_NAME_INDEX[column]"""
+
+    if column not in _EMOJI_NAME_INDEX:
+        if column is None:
+            index = {}
+            for name_column in reversed(['name', *LANGUAGES, 'alias']):
+                index.update(get_emoji_name_index(name_column))
+        elif column == 'alias':
+            index = {alias: emj for emj, data in reversed(EMOJI_DATA.items())
+                     for alias in reversed(data.get('alias') or [])}
+        elif column == 'name' or column in LANGUAGES:
+            index = {data[column]: emj for emj, data in reversed(EMOJI_DATA.items())
+                     if data.get(column)}
+        else:
+            raise ValueError(f"Unknown name column {column!r}")
+        _EMOJI_NAME_INDEX[column] = index
+
+    return _EMOJI_NAME_INDEX[column]
+
 def get_categories_data() -> Dict:
     categories = []
     unique_categories = []
@@ -1,4 +1,8 @@
+import random
+import re
+from array import array
 import core as emojix
+import tokenizer
 
 def test_category_exists():
     print("test_category_exists()")
@@ -108,6 +112,372 @@ def test_get_emoji_by_name():
         return True
     return False
   
+def test_tokenize_automaton():
+    print("test_tokenize_automaton()")
+    text = "Hi 👍🏽, 👨‍👩🏿‍👧🏻‍👦🏾 and 🇺🇸!"
+    for keep_zwj in (True, False):
+        tree_tokens = [(t.chars, t.value.start if isinstance(t.value, tokenizer.EmojiMatch) else t.value)
+                       for t in tokenizer.tokenize(text, keep_zwj=keep_zwj)]
+        automaton_tokens = [(t.chars, t.value.start if isinstance(t.value, tokenizer.EmojiMatch) else t.value)
+                            for t in tokenizer.tokenize(text, keep_zwj=keep_zwj, backend="automaton")]
+        if tree_tokens != automaton_tokens:
+            return False
+    return True
+
+def test_get_emoji_regex():
+    print("test_get_emoji_regex()")
+    text = "Hi 👍🏽, 👨‍👩‍👧 and 🇺🇸!"
+    if [m.group() for m in tokenizer.get_emoji_regex().finditer(text)] != ["👍🏽", "👨‍👩‍👧", "🇺🇸"]:
+        return False
+    for keep_zwj in (True, False):
+        tree_tokens = [t.chars for t in tokenizer.tokenize(text, keep_zwj=keep_zwj)]
+        regex_tokens = [t.chars for t in tokenizer.tokenize(text, keep_zwj=keep_zwj, backend="regex")]
+        if tree_tokens != regex_tokens:
+            return False
+    return True
+
+def test_has_emoji():
+    print("test_has_emoji()")
+    if emojix.has_emoji("Hi, I am fine. 😁") == True and emojix.has_emoji("Hi, I am fine 123") == False:
+        return True
+    return False
+
+def test_tokenize_spans():
+    print("test_tokenize_spans()")
+    text = "Hello 👍🏽 world, 👨‍👩‍👧 ok"
+    spans = [t.chars for t in tokenizer.tokenize_spans(text, keep_zwj=True)]
+    if spans != ["Hello ", "👍🏽", " world, ", "👨‍👩‍👧", " ok"]:
+        return False
+    if emojix.demojize(text) != "Hello :thumbs_up_medium_skin_tone: world, :family_man_woman_girl: ok":
+        return False
+    return True
+
+def test_iter_matches():
+    print("test_iter_matches()")
+    text = "Hi 👍, 👨‍👩‍👧 and 🇺🇸!"
+    emojis = tokenizer.get_automaton().emojis
+    matches = list(tokenizer.iter_matches(text))
+    if [(start, end, emojis[index]) for start, end, index in matches] != [
+            (3, 4, "👍"), (6, 11, "👨‍👩‍👧"), (16, 18, "🇺🇸")]:
+        return False
+    starts, ends, indexes = array("I"), array("I"), array("I")
+    if tokenizer.collect_matches(text, starts, ends, indexes) != 3 or list(starts) != [3, 6, 16]:
+        return False
+    if len(tokenizer.EmojiAutomaton(["👍", "👍🏽", "🇺🇸"])) != 3:
+        return False
+    return emojix.emoji_count(text) == 3
+
+def _stream_tokens(text, sizes, keep_zwj):
+    stream = tokenizer.StreamTokenizer(keep_zwj=keep_zwj)
+    tokens = []
+    i = 0
+    for size in sizes:
+        tokens += stream.feed(text[i:i + size])
+        i += size
+    tokens += stream.feed(text[i:]) + stream.close()
+    return [(t.chars, t.value.start if isinstance(t.value, tokenizer.EmojiMatch) else None) for t in tokens]
+
+def _tokenize_tokens(text, keep_zwj):
+    return [(t.chars, t.value.start if isinstance(t.value, tokenizer.EmojiMatch) else None)
+            for t in tokenizer.tokenize(text, keep_zwj=keep_zwj)]
+
+def test_stream_tokenizer():
+    print("test_stream_tokenizer()")
+    text = "Hi 👨‍👩‍👧, 🇺🇸 and 👍🏽!"
+    for size in (1, 2, 5):
+        if _stream_tokens(text, [size] * len(text), True) != _tokenize_tokens(text, True):
+            return False
+    text = "b🫱🏻\u200d🫲🏾\u200d🏽\u200d"
+    if _stream_tokens(text, [1] * len(text), False) != _tokenize_tokens(text, False):
+        return False
+    stream = tokenizer.StreamTokenizer(keep_zwj=True)
+    tokens = []
+    for _ in range(200):
+        tokens += stream.feed("👍" * 100)
+    if len(tokens) < 19000:
+        return False
+    tokens += stream.close()
+    if [t.value.start for t in tokens] != list(range(20000)):
+        return False
+    return True
+
+def test_stream_tokenizer_random():
+    print("test_stream_tokenizer_random()")
+    rng = random.Random(0)
+    # ZWJ sequences with skin tones and loose ZWJs and components make the ZWJ handling go back the farthest
+    emojis = [emj for emj in emojix.EMOJI_DATA if "\u200d" in emj and any("🏻" <= char <= "🏿" for char in emj)]
+    parts = [rng.choice(emojis) for _ in range(20)] + ["\u200d"] * 8 + ["🏻", "🏽", "🦰", "👍", "b", "\ufe0f"]
+    for _ in range(2000):
+        text = "".join(rng.choice(parts) for _ in range(rng.randint(1, 12)))
+        sizes = [rng.randint(1, 4) for _ in range(len(text))]
+        for keep_zwj in (True, False):
+            if _stream_tokens(text, sizes, keep_zwj) != _tokenize_tokens(text, keep_zwj):
+                return False
+    return True
+
+def test_batch_functions():
+    print("test_batch_functions()")
+    texts = ["Python is fun 👍", "No emoji", "🌊 :water_wave:"]
+    if list(emojix.demojize_many(texts)) != [emojix.demojize(text) for text in texts]:
+        return False
+    if list(emojix.emojize_many(texts)) != [emojix.emojize(text) for text in texts]:
+        return False
+    if list(emojix.emoji_list_many(texts, workers=2, chunksize=1)) != [emojix.emoji_list(text) for text in texts]:
+        return False
+    return True
+
+def test_tokenize_bytes():
+    print("test_tokenize_bytes()")
+    text = "Hi 👨‍👩‍👧, 🇺🇸 and 👍🏽!"
+    data = text.encode("utf-8")
+    expected = [t.chars.encode("utf-8") for t in tokenizer.tokenize_spans(text, keep_zwj=True)]
+    if [t.chars for t in tokenizer.tokenize_bytes(memoryview(data), keep_zwj=True)] != expected:
+        return False
+    spans = [(t.value.start, t.value.end) for t in tokenizer.tokenize_bytes(data, keep_zwj=False)
+             if isinstance(t.value, tokenizer.EmojiMatch)]
+    if [data[start:end].decode("utf-8") for start, end in spans] != ["👨‍👩‍👧", "🇺🇸", "👍🏽"]:
+        return False
+    if emojix.demojize(data) != emojix.demojize(text).encode("utf-8"):
+        return False
+    return emojix.replace_emoji(bytearray(data), "_") == emojix.replace_emoji(text, "_").encode("utf-8")
+
+def test_retokenize():
+    print("test_retokenize()")
+    text = "Hi 👍, 👨‍👩 and 🇺🇸!"
+    matches = list(tokenizer.iter_matches(text))
+    for offset, removed, inserted in [(4, 0, "🏽"), (10, 0, "\u200d👧"), (0, 3, ""), (4, 2, "a 🌊")]:
+        expected = text[:offset] + inserted + text[offset + removed:]
+        text, matches = tokenizer.retokenize(text, matches, offset, removed, inserted)
+        if text != expected or matches != list(tokenizer.iter_matches(text)):
+            return False
+    text = "👍🏽12#👨‍👩‍👧🌊" * 5000
+    matches = list(tokenizer.iter_matches(text))
+    # Stale matches far from the edit stay as they are if the window is bounded
+    first, last = (0, 2, matches[1][2]), (len(text) - 1, len(text), matches[0][2])
+    matches[0], matches[-1] = first, last
+    text, matches = tokenizer.retokenize(text, matches, 25000, 1, "🇺🇸")
+    expected = list(tokenizer.iter_matches(text))
+    return matches[0] == first and matches[-1] == (last[0] + 1, last[1] + 1, last[2]) and matches[1:-1] == expected[1:-1]
+
+def test_emoji_matches():
+    print("test_emoji_matches()")
+    text = "Hi 👍, 👨‍👩‍👧 and 👍🌊!"
+    matches = emojix.emoji_matches(text)
+    if matches.to_list() != emojix.emoji_list(text) or len(matches) != 4:
+        return False
+    if matches[1].emoji != "👨‍👩‍👧" or (matches[-1].start, matches[-1].end) != (17, 18):
+        return False
+    if matches.counts() != {"👍": 2, "👨‍👩‍👧": 1, "🌊": 1}:
+        return False
+    thumbs_up = tokenizer.get_automaton().index_of("👍")
+    return list(matches.filter({thumbs_up}).starts) == [3, 16] and matches[1:].emojis() == ["👨‍👩‍👧", "👍", "🌊"]
+
+def test_name_indexes():
+    print("test_name_indexes()")
+    if emojix.get_emoji_by_name("ola_de_mar", language="es") != "🌊" or emojix.get_emoji_by_name("ola_de_mar") is not None:
+        return False
+    if emojix.get_emoji_by_name("thumbsup", language=None) != "👍":
+        return False
+    if emojix.emoji_name("🌊", language="es") != ":ola_de_mar:" or emojix.emoji_name("no emoji") is not None:
+        return False
+    if emojix.emoji_name_many(["🌊", "👍"]) != [":water_wave:", ":thumbs_up:"]:
+        return False
+    return emojix.get_emoji_by_name_many(["water_wave", "thumbs_up", "nothing"]) == ["🌊", "👍", None]
+
+def test_category_index():
+    print("test_category_index()")
+    children = emojix.child_categories(category="people_and_body", emojis_in_category=True)
+    person_role = [child for child in children if child["subcategory"] == "person_role"]
+    if len(person_role) != 1 or person_role[0]["emojis"] != emojix.get_emojis_in_category(category="person_role"):
+        return False
+    if emojix.parent_category(category="person_role") != {"category": "people_and_body", "id": emojix.CATEGORIES["people_and_body"]["id"]}:
+        return False
+    emojis = [item["emoji"] for item in emojix.emoji_factory(category="people_and_body")]
+    return "🧑‍⚕️" in emojis and emojis == [item["emoji"] for item in emojix.parent_category(category="person_role", emojis_in_category=True)]
+
+def test_category_sets():
+    print("test_category_sets()")
+    top_level_id = emojix.CATEGORIES["people_and_body"]["id"]
+    sub_level_id = emojix.CATEGORIES["people_and_body"]["person_role"]
+    if not emojix.category_exists(category_id=sub_level_id) or emojix.category_exists(category="no_such_category"):
+        return False
+    if emojix.is_top_level_category(category_id=top_level_id) is not True or emojix.is_top_level_category(category_id=sub_level_id) is not False:
+        return False
+    return emojix.is_top_level_category("no_such_category") is None
+
+def test_category_of_many():
+    print("test_category_of_many()")
+    record = emojix.category("🎃")
+    if record is not emojix.category("🎃") or emojix.category("no emoji") is not None:
+        return False
+    if [r and r["category"] for r in emojix.category_of_many(["🎃", "x", "👍"])] != ["activities", None, "people_and_body"]:
+        return False
+    return [r["emoji"] for r in emojix.categorize_text("Hi 🎃 and 👍!")] == ["🎃", "👍"]
+
+def test_variant_sets():
+    print("test_variant_sets()")
+    if emojix.has_alias("👍") is not True or emojix.alias("👍") != emojix.EMOJI_DATA["👍"]["alias"]:
+        return False
+    if emojix.has_alias("no emoji") is not None or emojix.alias("no emoji") is not None:
+        return False
+    variants = emojix.get_all_emoji_variants()
+    variants.clear()
+    return len(emojix.get_all_emoji_variants()) > 0 and emojix.is_emoji_variation("🕷") is True
+
+def test_version_index():
+    print("test_version_index()")
+    old_emojis = emojix.emojis_up_to_version(1)
+    if "😀" not in old_emojis or any(emojix.EMOJI_DATA[emj]["E"] > 1 for emj in old_emojis):
+        return False
+    new_emojis = emojix.emojis_in_version_range(14, 15)
+    if "🫨" not in new_emojis or any(not 14 <= emojix.EMOJI_DATA[emj]["E"] <= 15 for emj in new_emojis):
+        return False
+    if emojix.version("x 😁 y") != 0.6 or emojix.version("a :butterfly: b") != 3:
+        return False
+    allowed = emojix.allowed_set(1)
+    return allowed == frozenset(old_emojis) and allowed is emojix.allowed_set(1) and "🫨" not in allowed
+
+def test_suggest():
+    print("test_suggest()")
+    if emojix.suggest(":thumbs", limit=1) != [(":thumbs_up:", "👍")]:
+        return False
+    if emojix.suggest("thumbsu", language="alias") != [(":thumbsup:", "👍")]:
+        return False
+    weighted = emojix.suggest("thumbs", limit=2, weights={"👎": 10})
+    if weighted != [(":thumbs_down:", "👎"), (":thumbs_up:", "👍")]:
+        return False
+    if emojix.suggest(":", limit=0) != [] or emojix.suggest(":", limit=-1) != []:
+        return False
+    return emojix.suggest(":no_such_emoji") == [] and len(emojix.suggest(":", limit=7)) == 7
+
+def test_fuzzy_lookup():
+    print("test_fuzzy_lookup()")
+    if emojix.fuzzy_lookup(":thumbs_pu:", max_results=1)[0][:2] != (":thumbs_up:", "👍"):
+        return False
+    if emojix.fuzzy_lookup("thumbs_up", max_results=1)[0][2] != 1.0 or emojix.fuzzy_lookup("xyzzy")[0][2] >= 0.5:
+        return False
+    if emojix.emojize(":thumbs_pu: :xyzzy:", fuzzy=True) != "👍 :xyzzy:":
+        return False
+    return emojix.emojize(":thumbs_pu:") == ":thumbs_pu:"
+
+def test_emojis_containing():
+    print("test_emojis_containing()")
+    light = {emj for emj, data in emojix.EMOJI_DATA.items() if "1F3FB" in data["codepoints"]}
+    if emojix.emojis_containing("U+1F3FB") != light or emojix.emojis_containing(0x1F3FB) != light:
+        return False
+    if emojix.emojis_containing(["U+1F44D", "U+1F3FB"]) != {"👍🏻"} or emojix.emojis_containing("👍🏻") != {"👍🏻"}:
+        return False
+    try:
+        emojix.emojis_containing([])
+    except ValueError:
+        return True
+    return False
+
+def test_modifier_graph():
+    print("test_modifier_graph()")
+    if emojix.base_of("👍🏽") != "👍" or emojix.base_of("🧑🏻\u200d🦰") != "🧑" or emojix.base_of("👍") != "👍":
+        return False
+    if emojix.base_of("🏃🏿\u200d♀️") != "🏃" or emojix.base_of("👩🏻\u200d🤝\u200d👨🏿") != "👫":
+        return False
+    variants = emojix.variants_of("👍")
+    if variants[("🏽",)] != "👍🏽" or len(variants) != 5 or emojix.variants_of("👍🏽") != {}:
+        return False
+    return emojix.variants_of("🧑")[("🏻", "🦰")] == "🧑🏻\u200d🦰" and emojix.base_of("x") is None
+
+def test_emojizer():
+    print("test_emojizer()")
+    emojizer = emojix.Emojizer(language="alias")
+    if emojizer("Python is fun :thumbsup: :heart:") != "Python is fun 👍 ❤️" or emojizer.emojize(":x:") != "❌":
+        return False
+    if emojix.emojize("::thumbs_up::", delimiters=["::", "::"]) != "👍":
+        return False
+    if [emojix.emojize(":thumbs_up:", version=version) for version in range(100)] != [""] + ["👍"] * 99:
+        return False
+    # Unhashable settings are not cached
+    handle_version = type("Handler", (), {"__eq__": lambda self, other: False, "__str__": lambda self: "?"})()
+    return emojix.emojize(":thumbs_up:", version=0, handle_version=handle_version) == "?"
+
+def test_shortcode_table():
+    print("test_shortcode_table()")
+    if emojix.get_emoji_shortcode_table("en")["thumbs_up"] != "👍" or emojix.get_emoji_shortcode_table("alias")["thumbsup"] != "👍":
+        return False
+    if emojix.emojize("at 12:30:45 :thumbs_up:") != "at 12:30:45 👍":
+        return False
+    return emojix.emojize(":ｔｈｕｍｂｓ_ｕｐ:") == "👍"
+
+def test_emojizer_known_names():
+    print("test_emojizer_known_names()")
+    text = "at 12:30:45 :thumbs_up: :foo:red_heart: :ｔｈｕｍｂｓ_ｕｐ: host:8080:fire:"
+    known = emojix.Emojizer(known_names=True)
+    pattern = tokenizer.get_trie_pattern([":red:", ":red_heart:", ":rose:"])
+    if [m.group() for m in re.finditer(pattern, ":red_heart: :rose: :red:")] != [":red_heart:", ":rose:", ":red:"]:
+        return False
+    if known(text) != emojix.Emojizer(known_names=False)(text) or known(text) != emojix.emojize(text):
+        return False
+    if emojix.Emojizer().known_names or known.known_names is not True:
+        return False
+    try:
+        emojix.Emojizer(fuzzy=True, known_names=True)
+    except ValueError:
+        return True
+    return False
+
+def test_bare_words():
+    print("test_bare_words()")
+    text = "Thumbs up for the red heart, not the red hearts"
+    result = emojix.emojize(text, delimiters=None, bare_words=True)
+    if result != "👍 for the ❤️, not the red hearts":
+        return False
+    if emojix.emojize("100 pizza", delimiters=None, bare_words=True) != "100 🍕":
+        return False
+    automaton = tokenizer.PhraseAutomaton(["red", "red heart", "heart"])
+    if list(automaton.finditer("a red heart")) != [(2, 11, 1)] or len(automaton) != 3:
+        return False
+    for kwargs in ({'bare_words': True}, {'delimiters': None}, {'delimiters': None, 'bare_words': True, 'fuzzy': True}):
+        try:
+            emojix.emojize(text, **kwargs)
+        except ValueError:
+            continue
+        return False
+    return True
+
+def test_demojize_tables():
+    print("test_demojize_tables()")
+    if emojix.demojize("no emoji") != "no emoji":
+        return False
+    for _ in range(2):
+        if emojix.demojize("Python is fun 👍", delimiters=["__", "__"]) != "Python is fun __thumbs_up__":
+            return False
+        if emojix.demojize("👍 🙂", delimiters=("__", "__")) != "__thumbs_up__ __slightly_smiling_face__":
+            return False
+    # More settings than the cache holds, then the first ones again
+    settings = [(language, (left, "§")) for language in ('en', 'de', 'es', 'alias') for left in "<[{(|"]
+    expected = [emojix.demojize("a 👍🏽 b", delimiters=delimiters, language=language) for language, delimiters in settings]
+    if expected[0] != "a <thumbs_up_medium_skin_tone§ b" or expected[5] != "a <daumen_hoch_mittlere_hautfarbe§ b":
+        return False
+    return [emojix.demojize("a 👍🏽 b", delimiters=delimiters, language=language) for language, delimiters in settings] == expected
+
+def test_zwj_after_emoji():
+    print("test_zwj_after_emoji()")
+    string = "🙆\u200d♂️\u200d: x"
+    if [token.chars for token in emojix.analyze(string, non_emoji=True)] != ["🙆\u200d♂️", ":", " ", "x"]:
+        return False
+    keep_zwj = emojix.config.replace_emoji_keep_zwj
+    emojix.config.replace_emoji_keep_zwj = True
+    try:
+        return emojix.replace_emoji(string, "_") == "_: x"
+    finally:
+        emojix.config.replace_emoji_keep_zwj = keep_zwj
+
+def test_zwj_after_emoji_bytes():
+    print("test_zwj_after_emoji_bytes()")
+    for string in ("🙆\u200d♂️\u200d: x", "a👩🏼\u200d⚖️\u200d中ü"):
+        for keep_zwj in (True, False):
+            expected = [token.chars for token in tokenizer.tokenize_spans(string, keep_zwj)]
+            if [token.chars.decode("utf-8") for token in tokenizer.tokenize_bytes(string.encode("utf-8"), keep_zwj)] != expected:
+                return False
+    return True
+
 def begin_tests():
     if test_category_exists():
         print("Passed")
@@ -173,6 +543,118 @@ def begin_tests():
         print("Passed")
     else:
         print("Failed")
+    if test_tokenize_automaton():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_get_emoji_regex():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_has_emoji():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_tokenize_spans():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_iter_matches():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_stream_tokenizer():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_stream_tokenizer_random():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_batch_functions():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_tokenize_bytes():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_retokenize():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_emoji_matches():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_name_indexes():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_category_index():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_category_sets():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_category_of_many():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_variant_sets():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_version_index():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_suggest():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_fuzzy_lookup():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_emojis_containing():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_modifier_graph():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_emojizer():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_shortcode_table():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_emojizer_known_names():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_bare_words():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_demojize_tables():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_zwj_after_emoji():
+        print("Passed")
+    else:
+        print("Failed")
+    if test_zwj_after_emoji_bytes():
+        print("Passed")
+    else:
+        print("Failed")
 if __name__ == "__main__":
     begin_tests()
     
\ No newline at end of file
@@ -5,15 +5,39 @@ emoji.tokenizer
 Components for detecting and tokenizing emoji in strings.
 
 """
-from typing import NamedTuple, Dict, Union, Iterator, Any
+import re
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, deque
+from itertools import chain, compress
+from typing import NamedTuple, Dict, FrozenSet, List, Union, Iterator, Iterable, Tuple, Any
 from emoji_data.data_dict import EMOJI_DATA, STATUS
 
 __all__ = [
     'EmojiMatch', 'EmojiMatchZWJ', 'EmojiMatchZWJNonRGI', 'Token',
-    'tokenize', 'filter_tokens',
+    'EmojiAutomaton', 'PhraseAutomaton', 'EmojiMatches', 'StreamTokenizer', 'tokenize', 'tokenize_spans', 'iter_matches', 'collect_matches',
+    'tokenize_bytes', 'retokenize', 'filter_tokens', 'get_automaton',
+    'get_emoji_regex', 'get_trie_pattern', 'get_emoji_start_chars',
 ]
 _ZWJ = '\u200D'
 _SEARCH_TREE = None
+_AUTOMATON = None
+_NO_MATCH = 0xFFFFFFFF  # terminal value of states that do not end an emoji
+_STATE_SHIFT = 21  # code points fit in 21 bits, the state id goes above them
+# The words of PhraseAutomaton: runs of letters and digits, single other characters
+# except spaces, tabs and '_' between the words, and line breaks that end a phrase
+_PHRASE_WORD_REGEX = re.compile(r'[^\W_]+|[^\w\s]|[^\S \t]')
+_ZWJ_UTF8 = _ZWJ.encode('utf-8')
+_VS15_UTF8 = '\uFE0E'.encode('utf-8')
+_VS16_UTF8 = '\uFE0F'.encode('utf-8')
+_EMOJI_REGEX = {}  # Cache for the compiled emoji patterns per match policy and str/bytes
+_CANDIDATE_REGEX = None
+_START_UTF8_REGEX = None
+_CANDIDATE_UTF8_REGEX = None
+_EMOJI_START_CHARS = None
+_MAX_EMOJI_LENGTH = None
+_BACKENDS = ('tree', 'automaton', 'regex')
+_MATCH_POLICIES = ('longest', 'greedy')
 
 class EmojiMatch:
     """
@@ -147,7 +171,491 @@ class Token(NamedTuple):
     chars: str
     value: Union[str, EmojiMatch]
 
-def tokenize(string, keep_zwj: bool) -> Iterator[Token]:
+class EmojiAutomaton:
+    """
+    A compiled, flat version of the search tree from :func:`get_search_tree`.
+
+    Every node of the tree is a state id. The edges of all states live in one
+    dict keyed by ``state << 21 | code point`` and the root is state ``0``,
+    which is never the target of an edge, so ``0`` doubles as "no edge".
+    ``terminals[state]`` is the index in :attr:`emojis` of the emoji that
+    ends in that state. It needs about a third of the memory of the search
+    tree, a walk through it is not faster.
+    """
+
+    __slots__ = ('emojis', 'transitions', 'terminals')
+
+    def __init__(self, emojis: Iterable[str]):
+
+        self.emojis: Tuple[str, ...] = tuple(emojis)
+        """The matched emoji, the emoji index of a terminal state points in here"""
+
+        self.transitions: Dict[int, int] = {}
+        """Edges as ``{state << 21 | code point: next state}``"""
+
+        self.terminals = array('I', [_NO_MATCH])
+        """``array('I')`` of emoji indexes per state, ``0xFFFFFFFF`` if the state is not terminal"""
+
+        transitions = self.transitions
+        terminals = self.terminals
+        for index, emj in enumerate(self.emojis):
+            state = 0
+            for char in emj:
+                edge = state << _STATE_SHIFT | ord(char)
+                next_state = transitions.get(edge)
+                if next_state is None:
+                    next_state = len(terminals)
+                    terminals.append(_NO_MATCH)
+                    transitions[edge] = next_state
+                state = next_state
+            terminals[state] = index
+
+    def step(self, state: int, char: str) -> int:
+        """
+        Follows the edge labeled ``char`` from ``state``.
+
+        :returns: The next state or ``0`` if there is no such edge
+        """
+
+        return self.transitions.get(state << _STATE_SHIFT | ord(char), 0)
+
+    def emoji_index(self, state: int) -> Union[int, None]:
+        """
+        :returns: The index in :attr:`emojis` of the emoji that ends in ``state`` or None
+        """
+
+        index = self.terminals[state]
+        return None if index == _NO_MATCH else index
+
+    def index_of(self, emoji: str) -> Union[int, None]:
+        """
+        :returns: The index in :attr:`emojis` of ``emoji`` or None if it is not an emoji
+        """
+
+        state = 0
+        transitions = self.transitions
+        for char in emoji:
+            state = transitions.get(state << _STATE_SHIFT | ord(char), 0)
+            if not state:
+                return None
+        return self.emoji_index(state)
+
+    def __len__(self) -> int:
+        return len(self.emojis)
+
+class PhraseAutomaton:
+    """
+    An Aho-Corasick automaton over the words of phrases, that finds the phrases
+    in a string in one pass. Words are runs of letters and digits and single
+    other characters, they are compared case-insensitively. Spaces, tabs and
+    ``'_'`` separate the words of a phrase, so ``"thumbs_up"`` matches
+    ``"Thumbs up"`` but not ``"thumbs upward"``.
+
+    The states and edges are stored like in :class:`EmojiAutomaton` with word
+    ids instead of code points. ``fails[state]`` is the state of the longest
+    proper suffix of the words of ``state`` that is a prefix of a phrase and
+    ``outputs[state]`` the next state on that chain in which a phrase ends.
+    """
+
+    __slots__ = ('phrases', 'words', 'transitions', 'terminals', 'depths', 'fails', 'outputs')
+
+    def __init__(self, phrases: Iterable[str]):
+
+        self.phrases: Tuple[str, ...] = tuple(phrases)
+        """The phrases, the phrase index of a terminal state points in here"""
+
+        self.words: Dict[str, int] = {}
+        """Ids of the case folded words of the phrases"""
+
+        self.transitions: Dict[int, int] = {}
+        """Edges as ``{state << 21 | word id: next state}``"""
+
+        self.terminals = array('I', [_NO_MATCH])
+        """``array('I')`` of phrase indexes per state, ``0xFFFFFFFF`` if the state is not terminal"""
+
+        self.depths = array('I', [0])
+        """``array('I')`` of the number of words per state"""
+
+        words = self.words
+        transitions = self.transitions
+        terminals = self.terminals
+        depths = self.depths
+        children = {}
+        for index, phrase in enumerate(self.phrases):
+            state = 0
+            for word in _PHRASE_WORD_REGEX.findall(phrase):
+                edge = state << _STATE_SHIFT | words.setdefault(word.casefold(), len(words))
+                next_state = transitions.get(edge)
+                if next_state is None:
+                    next_state = len(terminals)
+                    terminals.append(_NO_MATCH)
+                    depths.append(depths[state] + 1)
+                    transitions[edge] = next_state
+                    children.setdefault(state, []).append((edge & ((1 << _STATE_SHIFT) - 1), next_state))
+                state = next_state
+            if state and terminals[state] == _NO_MATCH:
+                terminals[state] = index
+
+        self.fails = array('I', [0]) * len(terminals)
+        """``array('I')`` of the failure state per state"""
+
+        self.outputs = array('I', [0]) * len(terminals)
+        """``array('I')`` of the next terminal state on the failure chain per state, ``0`` if there is none"""
+
+        fails = self.fails
+        outputs = self.outputs
+        queue = deque(state for _, state in children.get(0, ()))
+        while queue:
+            state = queue.popleft()
+            for word, child in children.get(state, ()):
+                fail = fails[state]
+                while fail and fail << _STATE_SHIFT | word not in transitions:
+                    fail = fails[fail]
+                fail = transitions.get(fail << _STATE_SHIFT | word, 0)
+                fails[child] = fail
+                outputs[child] = fail if terminals[fail] != _NO_MATCH else outputs[fail]
+                queue.append(child)
+
+    def finditer(self, string: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Finds the phrases in a string. Of overlapping phrases the one that starts
+        first and then the longest one is found, like a regular expression would.
+
+        :returns: An iterator over ``(start, end, phrase index)`` tuples
+        """
+
+        words = self.words
+        transitions = self.transitions
+        terminals = self.terminals
+        depths = self.depths
+        fails = self.fails
+        outputs = self.outputs
+        state = 0
+        longest = {}  # The end word and phrase of the longest phrase per start word
+        spans = deque()  # The spans of the words from word index done on
+        done = 0  # No phrase can start before word index done anymore
+        free = 0  # The words before word index free are in a found phrase
+        for index, match in enumerate(chain(_PHRASE_WORD_REGEX.finditer(string), (None,))):
+            if match is None:
+                earliest = index
+            else:
+                spans.append(match.span())
+                word = words.get(match.group().casefold())
+                if word is None:
+                    state = 0
+                else:
+                    edge = state << _STATE_SHIFT | word
+                    while state and edge not in transitions:
+                        state = fails[state]
+                        edge = state << _STATE_SHIFT | word
+                    state = transitions.get(edge, 0)
+                    terminal = state if terminals[state] != _NO_MATCH else outputs[state]
+                    while terminal:
+                        # Phrases that end later are longer
+                        longest[index - depths[terminal] + 1] = (index, terminals[terminal])
+                        terminal = outputs[terminal]
+                # Any phrase that ends later starts after the words of the state
+                earliest = index - depths[state] + 1
+            while done < earliest:
+                found = longest.pop(done, None)
+                if found is not None and done >= free:
+                    end, phrase = found
+                    yield spans[0][0], spans[end - done][1], phrase
+                    free = end + 1
+                spans.popleft()
+                done += 1
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+class EmojiMatches:
+    """
+    The matches of :func:`iter_matches` in a string as three parallel ``array('I')``
+    columns instead of one object per match. The :class:`EmojiMatch` objects are
+    only created on indexing or iteration. The emoji id of a match is the index
+    of the emoji in ``get_automaton().emojis``.
+
+        >>> matches = EmojiMatches("Hi 👍, 👍 and 🌊!")
+        >>> len(matches), matches[-1].emoji, matches.counts()
+        (3, '🌊', {'👍': 2, '🌊': 1})
+    """
+
+    __slots__ = ('string', 'starts', 'ends', 'ids')
+
+    def __init__(self, string: str, keep_zwj: bool = False):
+
+        self.string = string
+        """The string that was searched"""
+
+        self.starts = array('I')
+        """``array('I')`` of the start index of each match"""
+
+        self.ends = array('I')
+        """``array('I')`` of the end index of each match"""
+
+        self.ids = array('I')
+        """``array('I')`` of the emoji id of each match"""
+
+        collect_matches(string, self.starts, self.ends, self.ids, keep_zwj)
+
+    def _select(self, starts: 'array[int]', ends: 'array[int]', ids: 'array[int]') -> 'EmojiMatches':
+        matches = EmojiMatches.__new__(EmojiMatches)
+        matches.string = self.string
+        matches.starts = starts
+        matches.ends = ends
+        matches.ids = ids
+        return matches
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[EmojiMatch, 'EmojiMatches']:
+        if isinstance(index, slice):
+            return self._select(self.starts[index], self.ends[index], self.ids[index])
+        emj = get_automaton().emojis[self.ids[index]]
+        return EmojiMatch(emj, self.starts[index], self.ends[index], EMOJI_DATA[emj])
+
+    def __iter__(self) -> Iterator[EmojiMatch]:
+        emojis = get_automaton().emojis
+        for start, end, emoji_id in zip(self.starts, self.ends, self.ids):
+            emj = emojis[emoji_id]
+            yield EmojiMatch(emj, start, end, EMOJI_DATA[emj])
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self)} matches)'
+
+    def emojis(self) -> List[str]:
+        """
+        :returns: The emoji of all matches
+        """
+
+        emojis = get_automaton().emojis
+        return [emojis[emoji_id] for emoji_id in self.ids]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        :returns: The number of matches per emoji, in the order of their first match
+        """
+
+        emojis = get_automaton().emojis
+        return {emojis[emoji_id]: count for emoji_id, count in Counter(self.ids).items()}
+
+    def filter(self, ids: Iterable[int]) -> 'EmojiMatches':
+        """
+        :param ids: Emoji ids, e.g. from ``get_automaton().index_of(emoji)``
+        :returns: The matches of the emoji in ``ids``
+        """
+
+        selectors = list(map(frozenset(ids).__contains__, self.ids))
+        return self._select(array('I', compress(self.starts, selectors)),
+                            array('I', compress(self.ends, selectors)),
+                            array('I', compress(self.ids, selectors)))
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """
+        :returns: The matches in the format of :func:`emoji.emoji_list`
+        """
+
+        emojis = get_automaton().emojis
+        return [{
+            'match_start': start,
+            'match_end': end,
+            'emoji': emojis[emoji_id],
+        } for start, end, emoji_id in zip(self.starts, self.ends, self.ids)]
+
+class StreamTokenizer:
+    """
+    Tokenizes a string that arrives in chunks, e.g. from a socket or a file.
+    Feeding all chunks and closing the stream gives the same tokens as
+    :func:`tokenize` for the concatenated string, including the offsets of
+    the :class:`EmojiMatch` objects, even if an emoji is split between two chunks.
+
+        >>> stream = StreamTokenizer(keep_zwj=True)
+        >>> tokens = stream.feed("Hi 👨\u200D👩") + stream.feed("\u200D👧!") + stream.close()
+        >>> [token.chars for token in tokens]
+        ['H', 'i', ' ', '👨\u200d👩\u200d👧', '!']
+
+    Only the unfinished tail of the input is kept: an emoji that could still be
+    continued by the next chunk and the tokens that a following ZWJ can still
+    change. Those are the last one or two tokens and the tokens before them
+    that the backtracking of :func:`tokenize` can reach from there.
+    """
+
+    __slots__ = ('keep_zwj', '_buffer', '_offset', '_i', '_result', '_starts', '_ignore', '_closed')
+
+    def __init__(self, keep_zwj: bool):
+
+        self.keep_zwj = keep_zwj
+        """Same as for :func:`tokenize`"""
+
+        self._buffer = ''
+        self._offset = 0  # index of self._buffer[0] in the whole stream
+        self._i = 0
+        self._result = []
+        self._starts = []  # index in self._buffer of every token in self._result
+        self._ignore = set()
+        self._closed = False
+
+    def feed(self, chunk: str) -> List[Token]:
+        """
+        Adds the next chunk of the string.
+
+        :param chunk: The next part of the string. MUST BE UNICODE.
+        :return: A list of the tokens that are complete, in the same form as from :func:`tokenize`
+        :raises ValueError: if the stream was already closed
+        """
+
+        if self._closed:
+            raise ValueError("Cannot feed a closed StreamTokenizer")
+        self._buffer += chunk
+        return self._scan(final=False)
+
+    def close(self) -> List[Token]:
+        """
+        Ends the string.
+
+        :return: A list of all remaining tokens
+        """
+
+        if self._closed:
+            return []
+        tokens = self._scan(final=True)
+        self._closed = True
+        return tokens
+
+    def _release(self, string: str, result: List[Token], starts: List[int]) -> List[Token]:
+        # Removes the pending tokens that no ZWJ can change anymore from result.
+        # A ZWJ after an emoji goes back over it, or over the two last tokens if
+        # the emoji is a component, by their length. With keep_zwj=False the
+        # skipped ZWJs have no length, so a skipped ZWJ between the two tokens
+        # lets it land inside of the first one, which is deleted all the same.
+        # Walking on from there can stop at a ZWJ in that token and go back
+        # over the tokens before it in the same way.
+        tree = get_search_tree()
+
+        def is_component(t):
+            data = EMOJI_DATA.get(result[t].chars)
+            return data is not None and data['status'] == STATUS['component']
+
+        def skipped_after(t):
+            return not self.keep_zwj and starts[t] + len(result[t].chars) < starts[t + 1]
+
+        first = len(result) - 1
+        entered = {first}  # tokens that a ZWJ can go back into the middle of
+        if is_component(first):
+            first -= 1
+            if skipped_after(first):
+                entered.add(first)
+        todo = list(entered) if not self.keep_zwj else []
+        while todo:
+            t = todo.pop()
+            zwj = string.find(_ZWJ, starts[t] + 1, starts[t] + len(result[t].chars))
+            while zwj != -1 and t > 0:
+                if string[zwj - 1] in tree:
+                    first = min(first, t - 1)
+                    nearer = []
+                    if EMOJI_DATA.get(string[zwj - 1], {}).get('status') == STATUS['component']:
+                        nearer.append(t - 1)
+                    if t > 1 and is_component(t - 1):
+                        first = min(first, t - 2)
+                        if skipped_after(t - 2):
+                            nearer.append(t - 2)
+                    for near in nearer:
+                        if near not in entered:
+                            entered.add(near)
+                            todo.append(near)
+                zwj = string.find(_ZWJ, zwj + 1, starts[t] + len(result[t].chars))
+
+        released = result[:first]
+        del result[:first]
+        del starts[:first]
+        return released
+
+    def _scan(self, final: bool) -> List[Token]:
+        # The loop of _tokenize_tree(), which stops when a walk through the
+        # search tree reaches the end of the buffer and could still continue
+        tree = get_search_tree()
+        string = self._buffer
+        offset = self._offset
+        keep_zwj = self.keep_zwj
+        result = self._result
+        starts = self._starts
+        ignore = self._ignore
+        tokens = []
+        i = self._i
+        length = len(string)
+        while i < length:
+            consumed = False
+            char = string[i]
+            if i in ignore:
+                i += 1
+                if char == _ZWJ and keep_zwj:
+                    result.append(Token(char, char))
+                    starts.append(i - 1)
+                continue
+
+            elif char in tree:
+                j = i + 1
+                sub_tree = tree[char]
+                while j < length and string[j] in sub_tree:
+                    if j in ignore:
+                        break
+                    sub_tree = sub_tree[string[j]]
+                    j += 1
+                if j == length and not final and len(sub_tree) > ('data' in sub_tree):
+                    # The next chunk may continue this emoji
+                    break
+                if 'data' in sub_tree:
+                    code_points = string[i:j]
+                    match_obj = EmojiMatch(code_points, offset + i, offset + j, sub_tree['data'])
+                    starts.append(i)
+                    i = j - 1
+                    consumed = True
+                    result.append(Token(code_points, match_obj))
+
+            elif char == _ZWJ and result and result[-1].chars in EMOJI_DATA and i > 0 and string[i - 1] in tree:
+                ignore.add(i)
+                if EMOJI_DATA[result[-1].chars]["status"] == STATUS["component"]:
+                    i = i - sum(len(t.chars) for t in result[-2:])
+                    if string[i] == _ZWJ:
+                        i += 1
+                        del result[-1]
+                        del starts[-1]
+                    else:
+                        del result[-2:]
+                        del starts[-2:]
+                else:
+                    i = i - len(result[-1].chars)
+                    del result[-1]
+                    del starts[-1]
+                continue
+
+            elif result:
+                tokens.extend(result)
+                result.clear()
+                starts.clear()
+
+            if not consumed and char != '\uFE0E' and char != '\uFE0F':
+                result.append(Token(char, char))
+                starts.append(i)
+            i += 1
+
+        if final:
+            tokens.extend(result)
+            result.clear()
+            starts.clear()
+        elif len(result) > 2:
+            tokens.extend(self._release(string, result, starts))
+
+        keep = starts[0] if starts else i
+        self._buffer = string[keep:]
+        self._offset = offset + keep
+        self._i = i - keep
+        starts[:] = [start - keep for start in starts]
+        self._ignore = {k - keep for k in ignore if k >= keep}
+        return tokens
+
+def tokenize(string, keep_zwj: bool, backend: str = 'tree') -> Iterator[Token]:
     """
     Finds unicode emoji in a string. Yields all normal characters as a named
     tuple :class:`Token` ``(char, char)`` and all emoji as :class:`Token` ``(chars, EmojiMatch)``.
@@ -155,9 +663,28 @@ def tokenize(string, keep_zwj: bool) -> Iterator[Token]:
     :param string: String contains unicode characters. MUST BE UNICODE.
     :param keep_zwj: Should ZWJ-characters (``\\u200D``) that join non-RGI emoji be
         skipped or should be yielded as normal characters
+    :param backend: (optional) The matcher used to find the emoji: ``'tree'`` walks the
+        nested dicts of :func:`get_search_tree`, ``'automaton'`` walks the flat
+        :class:`EmojiAutomaton` of :func:`get_automaton` and ``'regex'`` matches the
+        ``'greedy'`` pattern of :func:`get_emoji_regex` and skips plain text in C.
+        All of them yield the same tokens. Because every character still becomes a
+        :class:`Token`, none of them is faster than ``'tree'``: ``'regex'`` is about
+        as fast on mixed text and up to 25% slower on plain or emoji-dense text.
+        Use :func:`tokenize_spans` to profit from the skipped plain text.
     :return: An iterable of tuples :class:`Token` ``(char, char)`` or :class:`Token` ``(chars, EmojiMatch)``
+    :raises ValueError: if ``backend`` is not one of ``'tree'``, ``'automaton'`` or ``'regex'``
     """
 
+    if backend == 'tree':
+        return _tokenize_tree(string, keep_zwj)
+    elif backend == 'automaton':
+        return _tokenize_automaton(string, keep_zwj)
+    elif backend == 'regex':
+        return _tokenize_regex(string, keep_zwj)
+    raise ValueError(
+        "Parameter 'backend' must be one of %s" % ", ".join(repr(b) for b in _BACKENDS))
+
+def _tokenize_tree(string, keep_zwj: bool) -> Iterator[Token]:
     tree = get_search_tree()
     # result: [ Token(oldsubstring0, EmojiMatch), Token(char1, char1), ... ]
     result = []
@@ -225,6 +752,603 @@ def tokenize(string, keep_zwj: bool) -> Iterator[Token]:
 
     yield from result
 
+def _tokenize_automaton(string, keep_zwj: bool) -> Iterator[Token]:
+    # Same algorithm as _tokenize_tree(), but every tree lookup is replaced
+    # by a lookup in the flat edge dict of the automaton
+    automaton = get_automaton()
+    transitions = automaton.transitions
+    terminals = automaton.terminals
+    emojis = automaton.emojis
+    result = []
+    i = 0
+    length = len(string)
+    ignore = set()
+    while i < length:
+        consumed = False
+        char = string[i]
+        if i in ignore:
+            i += 1
+            if char == _ZWJ and keep_zwj:
+                result.append(Token(char, char))
+            continue
+
+        state = transitions.get(ord(char), 0)
+        if state:
+            j = i + 1
+            while j < length:
+                next_state = transitions.get(state << _STATE_SHIFT | ord(string[j]), 0)
+                if not next_state or j in ignore:
+                    break
+                state = next_state
+                j += 1
+            index = terminals[state]
+            if index != _NO_MATCH:
+                code_points = string[i:j]
+                match_obj = EmojiMatch(code_points, i, j, EMOJI_DATA[emojis[index]])
+
+                i = j - 1
+                consumed = True
+                result.append(Token(code_points, match_obj))
+
+        elif char == _ZWJ and result and result[-1].chars in EMOJI_DATA and i > 0 and ord(string[i - 1]) in transitions:
+            ignore.add(i)
+            if EMOJI_DATA[result[-1].chars]["status"] == STATUS["component"]:
+                i = i - sum(len(t.chars) for t in result[-2:])
+                if string[i] == _ZWJ:
+                    i += 1
+                    del result[-1]
+                else:
+                    del result[-2:]
+            else:
+                i = i - len(result[-1].chars)
+                del result[-1]
+            continue
+
+        elif result:
+            yield from result
+            result = []
+
+        if not consumed and char != '\uFE0E' and char != '\uFE0F':
+            result.append(Token(char, char))
+        i += 1
+
+    yield from result
+
+def tokenize_spans(string, keep_zwj: bool) -> Iterator[Token]:
+    """
+    Finds unicode emoji in a string like :func:`tokenize`, but yields every run
+    of normal characters between two emoji as a single :class:`Token` ``(text, text)``.
+    Only a ZWJ-character that directly follows an emoji (or such a ZWJ) is yielded
+    on its own as :class:`Token` ``(char, char)``, so the output can be passed
+    to :func:`filter_tokens`.
+
+    Joining the ``chars`` of the tokens gives the same string as for :func:`tokenize`,
+    but the number of tokens only grows with the number of emoji.
+
+    :param string: String contains unicode characters. MUST BE UNICODE.
+    :param keep_zwj: Should ZWJ-characters (``\\u200D``) that join non-RGI emoji be
+        skipped or should be yielded as normal characters
+    :return: An iterable of tuples :class:`Token` ``(text, text)`` or :class:`Token` ``(chars, EmojiMatch)``
+    """
+
+    return _join_spans(_tokenize_runs(string, keep_zwj), _ZWJ, '')
+
+def tokenize_bytes(data, keep_zwj: bool) -> Iterator[Token]:
+    """
+    Finds unicode emoji in UTF-8 encoded bytes like :func:`tokenize_spans`, without
+    decoding them first. Works on every bytes-like object that supports slicing,
+    e.g. ``bytes``, ``bytearray``, ``memoryview`` or ``mmap.mmap``.
+
+    The ``chars`` of the tokens are ``bytes`` and the ``start`` and ``end`` of the
+    :class:`EmojiMatch` are byte offsets into ``data``. The emoji in ``EmojiMatch.emoji``
+    are ``str`` as usual. Decoding the tokens gives the same tokens as
+    :func:`tokenize_spans` for ``data.decode('utf-8')``.
+
+        >>> [(t.chars, t.value.start, t.value.end) for t in tokenize_bytes("Hi 👍!".encode(), False)
+        ...  if isinstance(t.value, EmojiMatch)]
+        [(b'\\xf0\\x9f\\x91\\x8d', 3, 7)]
+
+    :param data: Bytes that contain UTF-8 encoded text. MUST BE VALID UTF-8.
+    :param keep_zwj: Same as for :func:`tokenize`
+    :return: An iterable of tuples :class:`Token` ``(bytes, bytes)`` or :class:`Token` ``(bytes, EmojiMatch)``
+    """
+
+    return _join_spans(_tokenize_utf8(data, keep_zwj), _ZWJ_UTF8, b'')
+
+def _join_spans(tokens: Iterable[Token], zwj, empty) -> Iterator[Token]:
+    # Merges the normal characters between two emoji into one token,
+    # a ZWJ that directly follows an emoji stays a token of its own
+    text = []
+    after_emoji = False
+    for token in tokens:
+        if isinstance(token.value, EmojiMatch):
+            if text:
+                span = empty.join(text)
+                yield Token(span, span)
+                text = []
+            yield token
+            after_emoji = True
+        elif after_emoji and token.chars == zwj:
+            yield token
+        else:
+            after_emoji = False
+            text.append(token.chars)
+    if text:
+        span = empty.join(text)
+        yield Token(span, span)
+
+def iter_matches(string, keep_zwj: bool = False) -> Iterator[Tuple[int, int, int]]:
+    """
+    Finds the same emoji as :func:`tokenize`, but yields every match as a plain
+    tuple ``(start, end, emoji_index)`` without creating :class:`EmojiMatch` or
+    :class:`Token` objects. ``emoji_index`` is the index of the emoji in
+    ``get_automaton().emojis``, i.e. its position in :data:`EMOJI_DATA`.
+
+        >>> emojis = get_automaton().emojis
+        >>> [(start, end, emojis[index]) for start, end, index in iter_matches("Hi 👍!")]
+        [(3, 4, '👍')]
+
+    :param string: String contains unicode characters. MUST BE UNICODE.
+    :param keep_zwj: Same as for :func:`tokenize`
+    :return: An iterable of tuples ``(start, end, emoji_index)``
+    """
+
+    index_of = get_automaton().index_of
+    if _ZWJ not in string:
+        # Without a ZWJ tokenize() never backtracks, so its emoji are
+        # exactly the matches of the 'greedy' pattern
+        for match in get_emoji_regex('greedy').finditer(string):
+            start, end = match.span()
+            yield start, end, index_of(string[start:end])
+        return
+
+    yield from _iter_matches_automaton(string, keep_zwj)
+
+def _iter_matches_automaton(string, keep_zwj: bool) -> Iterator[Tuple[int, int, int]]:
+    # Same algorithm as _tokenize_automaton(), but the pending result holds
+    # tuples (start, end, emoji_index) with _NO_MATCH as the index of normal
+    # characters, and every run of characters that can neither start an emoji
+    # nor is a ZWJ is found with a single search() like in _tokenize_runs()
+    automaton = get_automaton()
+    transitions = automaton.transitions
+    terminals = automaton.terminals
+    find_candidate = _get_candidate_regex().search
+    result = []
+    i = 0
+    length = len(string)
+    ignore = set()
+    while i < length:
+        char = string[i]
+        if i in ignore:
+            i += 1
+            if char == _ZWJ and keep_zwj:
+                result.append((i - 1, i, _NO_MATCH))
+            continue
+
+        state = transitions.get(ord(char), 0)
+        if state:
+            j = i + 1
+            while j < length:
+                next_state = transitions.get(state << _STATE_SHIFT | ord(string[j]), 0)
+                if not next_state or j in ignore:
+                    break
+                state = next_state
+                j += 1
+            index = terminals[state]
+            if index != _NO_MATCH:
+                result.append((i, j, index))
+                i = j
+            else:
+                result.append((i, i + 1, _NO_MATCH))
+                i += 1
+            continue
+
+        if char == _ZWJ:
+            last = string[result[-1][0]:result[-1][1]] if result else None
+            if last in EMOJI_DATA and i > 0 and ord(string[i - 1]) in transitions:
+                ignore.add(i)
+                if EMOJI_DATA[last]["status"] == STATUS["component"]:
+                    i = i - sum(end - start for start, end, _ in result[-2:])
+                    if string[i] == _ZWJ:
+                        i += 1
+                        del result[-1]
+                    else:
+                        del result[-2:]
+                else:
+                    i = i - len(last)
+                    del result[-1]
+                continue
+
+            # A ZWJ that does not join emoji
+            for match in result:
+                if match[2] != _NO_MATCH:
+                    yield match
+            result = [(i, i + 1, _NO_MATCH)]
+            i += 1
+            continue
+
+        # A run of normal characters, only the last one stays pending
+        candidate = find_candidate(string, i + 1)
+        k = candidate.start() if candidate else length
+        for match in result:
+            if match[2] != _NO_MATCH:
+                yield match
+        last = string[k - 1]
+        result = [] if last == '\uFE0E' or last == '\uFE0F' else [(k - 1, k, _NO_MATCH)]
+        i = k
+
+    for match in result:
+        if match[2] != _NO_MATCH:
+            yield match
+
+def collect_matches(string, starts: 'array[int]', ends: 'array[int]',
+                    indexes: 'array[int]', keep_zwj: bool = False) -> int:
+    """
+    Appends the ``(start, end, emoji_index)`` of every match of :func:`iter_matches`
+    to the caller supplied buffers, e.g. three ``array('I')``.
+
+    :param string: String contains unicode characters. MUST BE UNICODE.
+    :param starts: Receives the start index of every match
+    :param ends: Receives the end index of every match
+    :param indexes: Receives the emoji index of every match
+    :param keep_zwj: Same as for :func:`tokenize`
+    :return: The number of matches that were appended
+    """
+
+    count = len(indexes)
+    for start, end, index in iter_matches(string, keep_zwj):
+        starts.append(start)
+        ends.append(end)
+        indexes.append(index)
+    return len(indexes) - count
+
+def retokenize(string, matches: List[Tuple[int, int, int]], offset: int, removed: int,
+               inserted: str) -> Tuple[str, List[Tuple[int, int, int]]]:
+    """
+    Updates the matches of :func:`iter_matches` after an edit of the string, e.g.
+    for the syntax highlighting of an editor. Only the window around the edit is
+    tokenized again, the other matches are kept and moved by the change in length.
+
+    The window reaches a few times the length of the longest emoji past either
+    side of the edit and never ends next to a ZWJ or inside of a match. An edit
+    changes at most the matches that start one emoji length before it, or two
+    for the backtracking of the ZWJ handling of :func:`tokenize`, so the window
+    is accepted when its outer matches are the same as before the edit.
+    Otherwise the greedy matching depends on text further away, e.g. in a long
+    run of flags, and the window is doubled.
+
+        >>> text, matches = retokenize("Hi 👍!", list(iter_matches("Hi 👍!")), 4, 0, "🏽")
+        >>> [text[start:end] for start, end, _ in matches]
+        ['👍🏽']
+
+    :param string: The string before the edit. MUST BE UNICODE.
+    :param matches: The list of tuples ``(start, end, emoji_index)`` of :func:`iter_matches`
+        for ``string``
+    :param offset: Index of the edit in ``string``
+    :param removed: Number of characters that were removed at ``offset``
+    :param inserted: The string that was inserted at ``offset``
+    :return: A tuple of the edited string and the list of its matches
+    :raises ValueError: if the edit is outside of ``string``
+    """
+
+    if offset < 0 or removed < 0 or offset + removed > len(string):
+        raise ValueError("The edit must be inside of the string")
+    text = string[:offset] + inserted + string[offset + removed:]
+    length = len(text)
+    delta = len(inserted) - removed
+    edit_end = offset + len(inserted)
+    reach = 2 * (_get_max_emoji_length() + 1)
+    margin = 2 * reach
+    while True:
+        start = max(offset - margin, 0)
+        while True:
+            # Move the start out of an old match and of a ZWJ chain,
+            # the text before the edit did not change
+            before = bisect_left(matches, (start,))
+            if before and matches[before - 1][1] > start:
+                start = matches[before - 1][0]
+            elif start > 0 and (text[start] == _ZWJ or text[start - 1] == _ZWJ):
+                start -= 1
+            else:
+                break
+        end = min(edit_end + margin, length)
+        while True:
+            # Same for the end, the text after the edit only moved by delta
+            after = bisect_left(matches, (end - delta,))
+            if after and matches[after - 1][0] >= offset + removed and matches[after - 1][1] > end - delta:
+                end = matches[after - 1][1] + delta
+            elif end < length and (text[end] == _ZWJ or text[end - 1] == _ZWJ):
+                end += 1
+            else:
+                break
+
+        found = [(start + first, start + last, index)
+                 for first, last, index in iter_matches(text[start:end])]
+        # The matches more than reach before or after the edit are not changed
+        # by it, if the window has the same ones, it starts and ends in sync
+        left = offset - reach
+        right = edit_end + reach
+        if start > 0 and [m for m in found if m[1] <= left] != \
+                [m for m in matches[before:bisect_left(matches, (left,))] if m[1] <= left]:
+            margin *= 2
+            continue
+        if end < length and [m for m in found if m[0] >= right] != \
+                [(first + delta, last + delta, index) for first, last, index
+                 in matches[bisect_left(matches, (right - delta,)):after]]:
+            margin *= 2
+            continue
+        return text, matches[:before] + found + [
+            (first + delta, last + delta, index) for first, last, index in matches[after:]]
+
+def _tokenize_regex(string, keep_zwj: bool) -> Iterator[Token]:
+    # Same algorithm as _tokenize_tree(), but the walk through the search tree
+    # is done by the 'greedy' emoji pattern and every run of characters that
+    # can neither start an emoji nor is a ZWJ is found with a single search().
+    tree = get_search_tree()
+    match_emoji = get_emoji_regex('greedy').match
+    find_candidate = _get_candidate_regex().search
+    result = []
+    i = 0
+    length = len(string)
+    ignore = set()
+    ignored = []  # the indexes in ignore, sorted
+    next_ignored = length  # the first index in ignore after i, or length
+    while i < length:
+        char = string[i]
+        if i in ignore:
+            i += 1
+            if char == _ZWJ and keep_zwj:
+                result.append(Token(char, char))
+            continue
+
+        elif char in tree:
+            # An ignored ZWJ ends the walk through the tree like the end of the string
+            if next_ignored <= i:
+                k = bisect_right(ignored, i)
+                next_ignored = ignored[k] if k < len(ignored) else length
+            match = match_emoji(string, i, next_ignored)
+            if match:
+                j = match.end()
+                code_points = string[i:j]
+                match_obj = EmojiMatch(code_points, i, j, EMOJI_DATA[code_points])
+                result.append(Token(code_points, match_obj))
+                i = j
+                continue
+            if char != '\uFE0E' and char != '\uFE0F':
+                result.append(Token(char, char))
+            i += 1
+            continue
+
+        elif char == _ZWJ and result and result[-1].chars in EMOJI_DATA and i > 0 and string[i - 1] in tree:
+            ignore.add(i)
+            insort(ignored, i)
+            if EMOJI_DATA[result[-1].chars]["status"] == STATUS["component"]:
+                i = i - sum(len(t.chars) for t in result[-2:])
+                if string[i] == _ZWJ:
+                    i += 1
+                    del result[-1]
+                else:
+                    del result[-2:]
+            else:
+                i = i - len(result[-1].chars)
+                del result[-1]
+            next_ignored = ignored[bisect_right(ignored, i)]
+            continue
+
+        elif char == _ZWJ:
+            # A ZWJ that does not join emoji stays its own token, so that
+            # filter_tokens() can still drop it, and never starts a run
+            yield from result
+            result = [Token(char, char)]
+            i += 1
+            continue
+
+        # A run of normal characters: each of them would flush the
+        # pending result and then become the new pending result
+        candidate = find_candidate(string, i + 1)
+        k = candidate.start() if candidate else length
+        yield from result
+        run = string[i:k]
+        if '\uFE0E' in run or '\uFE0F' in run:
+            run = run.replace('\uFE0E', '').replace('\uFE0F', '')
+        result = list(map(Token._make, zip(run, run)))
+        if string[k - 1] == '\uFE0E' or string[k - 1] == '\uFE0F':
+            yield from result
+            result = []
+        elif len(result) > 1:
+            yield from result[:-1]
+            result = result[-1:]
+        i = k
+
+    yield from result
+
+def _tokenize_runs(string, keep_zwj: bool) -> Iterator[Token]:
+    # Same algorithm as _tokenize_tree(), but every run of characters that can
+    # neither start an emoji nor is a ZWJ is found with a single search() and
+    # yielded as one token. Its last character stays pending on its own, so the
+    # backtracking of the ZWJ handling sees the same tokens as in _tokenize_tree().
+    tree = get_search_tree()
+    find_candidate = _get_candidate_regex().search
+    result = []
+    i = 0
+    length = len(string)
+    ignore = set()
+    while i < length:
+        char = string[i]
+        if i in ignore:
+            i += 1
+            if char == _ZWJ and keep_zwj:
+                result.append(Token(char, char))
+            continue
+
+        elif char in tree:
+            j = i + 1
+            sub_tree = tree[char]
+            while j < length and string[j] in sub_tree:
+                if j in ignore:
+                    break
+                sub_tree = sub_tree[string[j]]
+                j += 1
+            if 'data' in sub_tree:
+                code_points = string[i:j]
+                match_obj = EmojiMatch(code_points, i, j, sub_tree['data'])
+                result.append(Token(code_points, match_obj))
+                i = j
+                continue
+            if char != '\uFE0E' and char != '\uFE0F':
+                result.append(Token(char, char))
+            i += 1
+            continue
+
+        elif char == _ZWJ and result and result[-1].chars in EMOJI_DATA and i > 0 and string[i - 1] in tree:
+            ignore.add(i)
+            if EMOJI_DATA[result[-1].chars]["status"] == STATUS["component"]:
+                i = i - sum(len(t.chars) for t in result[-2:])
+                if string[i] == _ZWJ:
+                    i += 1
+                    del result[-1]
+                else:
+                    del result[-2:]
+            else:
+                i = i - len(result[-1].chars)
+                del result[-1]
+            continue
+
+        elif char == _ZWJ:
+            # A ZWJ that does not join emoji stays its own token, so that
+            # filter_tokens() can still drop it, and never starts a run
+            yield from result
+            result = [Token(char, char)]
+            i += 1
+            continue
+
+        candidate = find_candidate(string, i + 1)
+        k = candidate.start() if candidate else length
+        yield from result
+        run = string[i:k]
+        if '\uFE0E' in run or '\uFE0F' in run:
+            run = run.replace('\uFE0E', '').replace('\uFE0F', '')
+        if string[k - 1] == '\uFE0E' or string[k - 1] == '\uFE0F':
+            if run:
+                yield Token(run, run)
+            result = []
+        elif len(run) > 1:
+            yield Token(run[:-1], run[:-1])
+            result = [Token(run[-1], run[-1])]
+        else:
+            result = [Token(run, run)] if run else []
+        i = k
+
+    yield from result
+
+def _previous_char(data, i: int) -> int:
+    # Start of the UTF-8 encoded character that ends at byte offset i,
+    # continuation bytes look like 0b10xxxxxx
+    i -= 1
+    while data[i] & 0xC0 == 0x80:
+        i -= 1
+    return i
+
+def _char_count(chars: bytes) -> int:
+    # Number of characters in UTF-8 encoded bytes
+    return len(chars) - sum(1 for byte in chars if byte & 0xC0 == 0x80)
+
+def _tokenize_utf8(data, keep_zwj: bool) -> Iterator[Token]:
+    # Same algorithm as _tokenize_runs(), but on UTF-8 encoded bytes and with
+    # the 'greedy' bytes pattern instead of the search tree. The backtracking of the ZWJ handling
+    # goes back by characters, not bytes, to land on the same character as
+    # _tokenize_tree() does, because the skipped ZWJ and variation selectors
+    # have a different length in bytes than the emoji around them.
+    match_emoji = get_emoji_regex('greedy', binary=True).match
+    match_start = _get_start_utf8_regex().match
+    find_candidate = _get_candidate_utf8_regex().search
+    result = []
+    i = 0
+    length = len(data)
+    ignore = set()
+    ignored = []
+    next_ignored = length
+    while i < length:
+        if i in ignore:
+            # Only ZWJs are ever ignored
+            i += len(_ZWJ_UTF8)
+            if keep_zwj:
+                result.append(Token(_ZWJ_UTF8, _ZWJ_UTF8))
+            continue
+
+        start = match_start(data, i)
+        if start:
+            # An ignored ZWJ ends the walk through the tree like the end of the data
+            if next_ignored <= i:
+                k = bisect_right(ignored, i)
+                next_ignored = ignored[k] if k < len(ignored) else length
+            match = match_emoji(data, i, next_ignored)
+            if match:
+                j = match.end()
+                code_points = bytes(data[i:j])
+                emoji = code_points.decode('utf-8')
+                result.append(Token(code_points, EmojiMatch(emoji, i, j, EMOJI_DATA[emoji])))
+                i = j
+                continue
+            char = bytes(start.group())
+            if char != _VS15_UTF8 and char != _VS16_UTF8:
+                result.append(Token(char, char))
+            i = start.end()
+            continue
+
+        if data[i:i + 3] == _ZWJ_UTF8 and result and result[-1].chars.decode('utf-8') in EMOJI_DATA \
+                and i > 0 and match_start(data, _previous_char(data, i), i):
+            ignore.add(i)
+            insort(ignored, i)
+            if EMOJI_DATA[result[-1].chars.decode('utf-8')]["status"] == STATUS["component"]:
+                for _ in range(sum(_char_count(t.chars) for t in result[-2:])):
+                    i = _previous_char(data, i)
+                if data[i:i + 3] == _ZWJ_UTF8:
+                    i += len(_ZWJ_UTF8)
+                    del result[-1]
+                else:
+                    del result[-2:]
+            else:
+                for _ in range(_char_count(result[-1].chars)):
+                    i = _previous_char(data, i)
+                del result[-1]
+            next_ignored = ignored[bisect_right(ignored, i)]
+            continue
+
+        if data[i:i + 3] == _ZWJ_UTF8:
+            # A ZWJ that does not join emoji stays its own token, see _tokenize_runs()
+            yield from result
+            result = [Token(_ZWJ_UTF8, _ZWJ_UTF8)]
+            i += len(_ZWJ_UTF8)
+            continue
+
+        # A run of normal characters, see _tokenize_runs(). A candidate is
+        # never found inside of a character, because the encoding of every
+        # candidate starts with an ASCII or a lead byte.
+        lead = data[i]
+        candidate = find_candidate(data, i + (1 if lead < 0xC0 else 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4))
+        k = candidate.start() if candidate else length
+        yield from result
+        run = bytes(data[i:k])
+        ends_with_vs = run[-3:] == _VS15_UTF8 or run[-3:] == _VS16_UTF8
+        if _VS15_UTF8 in run or _VS16_UTF8 in run:
+            run = run.replace(_VS15_UTF8, b'').replace(_VS16_UTF8, b'')
+        if run:
+            last = _previous_char(run, len(run))
+            result = [Token(run[:last], run[:last]), Token(run[last:], run[last:])] if last else \
+                [Token(run, run)]
+        else:
+            result = []
+        if ends_with_vs:
+            yield from result
+            result = []
+        elif len(result) > 1:
+            yield from result[:-1]
+            result = result[-1:]
+        i = k
+
+    yield from result
+
 def filter_tokens(matches: Iterator[Token], emoji_only: bool, join_emoji: bool) -> Iterator[Token]:
     """
     Filters the output of `tokenize()`
@@ -348,3 +1472,197 @@ def get_search_tree() -> Dict[str, Any]:
                 if i == lastidx:
                     sub_tree['data'] = EMOJI_DATA[emj]
     return _SEARCH_TREE
+
+def get_automaton() -> EmojiAutomaton:
+    """
+    Compile the keys of :data:`EMOJI_DATA` into an :class:`EmojiAutomaton`.
+    It holds the same paths as the search tree of :func:`get_search_tree`
+    in a single dict of ints and an ``array('I')`` instead of one dict per
+    node. The automaton is only compiled once and then cached in _AUTOMATON.
+    """
+    global _AUTOMATON
+    if _AUTOMATON is None:
+        _AUTOMATON = EmojiAutomaton(EMOJI_DATA)
+    return _AUTOMATON
+
+def _char_class(chars: Iterable[str]) -> str:
+    # A character class with runs of consecutive code points collapsed into
+    # ranges, the regex engine checks long lists of single characters one by one
+    ranges = []
+    for code_point in sorted(set(ord(char) for char in chars)):
+        if ranges and ranges[-1][1] == code_point - 1:
+            ranges[-1][1] = code_point
+        else:
+            ranges.append([code_point, code_point])
+    return '[%s]' % ''.join(
+        re.escape(chr(first)) if first == last else
+        '%s-%s' % (re.escape(chr(first)), re.escape(chr(last))) for first, last in ranges)
+
+def _trie_pattern(tree: Dict[str, Any], greedy: bool) -> str:
+    # Builds the pattern for the sub tree below one node. The children of a
+    # node start with distinct characters, so at most one alternative can match.
+    leaves = []
+    alternatives = []
+    for char in sorted(key for key in tree if key != 'data'):
+        sub_tree = tree[char]
+        if len(sub_tree) == 1 and 'data' in sub_tree:
+            leaves.append(char)
+        else:
+            alternatives.append(re.escape(char) + _trie_pattern(sub_tree, greedy))
+    if len(leaves) == 1:
+        alternatives.append(re.escape(leaves[0]))
+    elif leaves:
+        alternatives.append(_char_class(leaves))
+    if not alternatives:
+        return ''
+    if 'data' not in tree:
+        return '(?:%s)' % '|'.join(alternatives)
+    if not greedy:
+        return '(?:%s)?' % '|'.join(alternatives)
+    # The search tree only stops on this node if the next character is not a child
+    children = _char_class(key for key in tree if key != 'data')
+    return '(?:%s|(?!%s))' % ('|'.join(alternatives), children)
+
+def _byte_class(values: Iterable[int]) -> bytes:
+    # Same as _char_class() for single bytes
+    return _char_class(chr(value) for value in values).encode('latin-1')
+
+def _alternation_utf8(branches: List[Tuple[bytes, bytes]]) -> bytes:
+    # Factors the UTF-8 encoded characters of the branches by their bytes, so the
+    # regex engine never tries more than one of them. UTF-8 is prefix free,
+    # so no encoded character is the start of another one.
+    groups = {}
+    for encoded, tail in branches:
+        groups.setdefault(encoded[0], []).append((encoded[1:], tail))
+    last_bytes = []
+    alternatives = []
+    for byte, group in sorted(groups.items()):
+        head = re.escape(bytes([byte]))
+        if len(group) > 1:
+            alternatives.append(head + _alternation_utf8(group))
+        elif group[0] == (b'', b''):
+            last_bytes.append(byte)
+        else:
+            alternatives.append(head + re.escape(group[0][0]) + group[0][1])
+    if len(last_bytes) == 1:
+        alternatives.append(re.escape(bytes(last_bytes)))
+    elif last_bytes:
+        alternatives.append(_byte_class(last_bytes))
+    return alternatives[0] if len(alternatives) == 1 else b'(?:%s)' % b'|'.join(alternatives)
+
+def _trie_pattern_utf8(tree: Dict[str, Any], greedy: bool) -> bytes:
+    # Same as _trie_pattern() for the UTF-8 encoded characters
+    branches = []
+    for char in sorted(key for key in tree if key != 'data'):
+        sub_tree = tree[char]
+        tail = b'' if len(sub_tree) == 1 and 'data' in sub_tree else _trie_pattern_utf8(sub_tree, greedy)
+        branches.append((char.encode('utf-8'), tail))
+    if not branches:
+        return b''
+    alternatives = _alternation_utf8(branches)
+    if 'data' not in tree:
+        return b'(?:%s)' % alternatives
+    if not greedy:
+        return b'(?:%s)?' % alternatives
+    children = _alternation_utf8([(encoded, b'') for encoded, _ in branches])
+    return b'(?:%s|(?!%s))' % (alternatives, children)
+
+def get_emoji_regex(policy: str = 'longest', binary: bool = False) -> 're.Pattern':
+    """
+    Compile all keys of :data:`EMOJI_DATA` into a single regular expression.
+    The alternatives are factored like the search tree of :func:`get_search_tree`,
+    so the regex engine never tries more than one emoji per character.
+    Each pattern is only compiled once and then cached in _EMOJI_REGEX[policy, binary].
+
+        >>> [m.group() for m in get_emoji_regex().finditer("Hi 👍🏽!")]
+        ['👍🏽']
+
+    :param policy: (optional) ``'longest'`` matches the longest emoji that starts at
+        a position. ``'greedy'`` follows the search tree as far as the string
+        allows and only matches if that path ends in an emoji, exactly like
+        :func:`tokenize`.
+    :param binary: (optional) If True, the pattern matches the UTF-8 encoded emoji
+        in ``bytes``, ``memoryview`` or ``mmap.mmap`` and the match positions are byte offsets.
+    :raises ValueError: if ``policy`` is neither ``'longest'`` nor ``'greedy'``
+    """
+
+    if policy not in _MATCH_POLICIES:
+        raise ValueError(
+            "Parameter 'policy' must be either 'longest' or 'greedy'")
+    key = (policy, binary)
+    if key not in _EMOJI_REGEX:
+        tree = get_search_tree()
+        # The lookahead lets the regex engine reject plain characters with a
+        # single character class test instead of trying every alternative
+        if binary:
+            _EMOJI_REGEX[key] = re.compile(b'(?=%s)%s' % (
+                _byte_class(char.encode('utf-8')[0] for char in tree),
+                _trie_pattern_utf8(tree, greedy=policy == 'greedy')))
+        else:
+            _EMOJI_REGEX[key] = re.compile('(?=%s)%s' % (
+                _char_class(tree), _trie_pattern(tree, greedy=policy == 'greedy')))
+    return _EMOJI_REGEX[key]
+
+def get_trie_pattern(strings: Iterable[str]) -> str:
+    """
+    Builds a regular expression that matches any of the strings. The alternatives
+    are factored by their characters like in :func:`get_emoji_regex`, so the
+    regex engine never tries more than one of them per character. Of two strings
+    where one is the start of the other, the longer one is matched.
+
+        >>> re.fullmatch(get_trie_pattern(['red', 'red_heart', 'rose']), 'red_heart') is not None
+        True
+
+    :param strings: The strings to match, they must not be empty
+    :returns: The pattern as a ``str``, to be compiled or used in a larger pattern
+    """
+
+    tree = {}
+    for string in strings:
+        node = tree
+        for char in string:
+            node = node.setdefault(char, {})
+        node['data'] = string
+    return _trie_pattern(tree, False)
+
+def _get_candidate_regex() -> 're.Pattern[str]':
+    # Matches every character that can start an emoji and the ZWJ
+    global _CANDIDATE_REGEX
+    if _CANDIDATE_REGEX is None:
+        _CANDIDATE_REGEX = re.compile(_char_class([*get_search_tree(), _ZWJ]))
+    return _CANDIDATE_REGEX
+
+def _get_start_utf8_regex() -> 're.Pattern[bytes]':
+    # Matches the UTF-8 encoding of every character that can start an emoji
+    global _START_UTF8_REGEX
+    if _START_UTF8_REGEX is None:
+        _START_UTF8_REGEX = re.compile(_alternation_utf8(
+            [(char.encode('utf-8'), b'') for char in get_search_tree()]))
+    return _START_UTF8_REGEX
+
+def _get_candidate_utf8_regex() -> 're.Pattern[bytes]':
+    # Same as _get_candidate_regex() for UTF-8 encoded bytes
+    global _CANDIDATE_UTF8_REGEX
+    if _CANDIDATE_UTF8_REGEX is None:
+        _CANDIDATE_UTF8_REGEX = re.compile(_alternation_utf8(
+            [(char.encode('utf-8'), b'') for char in [*get_search_tree(), _ZWJ]]))
+    return _CANDIDATE_UTF8_REGEX
+
+def _get_max_emoji_length() -> int:
+    # Number of characters of the longest emoji
+    global _MAX_EMOJI_LENGTH
+    if _MAX_EMOJI_LENGTH is None:
+        _MAX_EMOJI_LENGTH = max(map(len, EMOJI_DATA))
+    return _MAX_EMOJI_LENGTH
+
+def get_emoji_start_chars() -> FrozenSet[str]:
+    """
+    Returns the set of all characters that can start an emoji, i.e. the first
+    level of the search tree of :func:`get_search_tree`. A string that contains
+    none of them contains no emoji. The set is only built once and then cached
+    in _EMOJI_START_CHARS.
+    """
+    global _EMOJI_START_CHARS
+    if _EMOJI_START_CHARS is None:
+        _EMOJI_START_CHARS = frozenset(get_search_tree())
+    return _EMOJI_START_CHARS
@@ -1,4 +1,8 @@
-from typing import NamedTuple, Union, Dict, Iterator, Any
+import re
+from array import array
+from mmap import mmap
+from typing import NamedTuple, Union, Dict, FrozenSet, List, Iterator, Iterable, Tuple, Any, overload
+from typing_extensions import Literal
 
 _SearchTree = Dict[str, Union['_SearchTree', dict[str, dict[str, Any]]]]
 
@@ -37,7 +41,73 @@ class Token(NamedTuple):
     value: str | EmojiMatch
 
 
-def tokenize(string, keep_zwj: bool) -> Iterator[Token]: ...
+class EmojiAutomaton:
+    emojis: Tuple[str, ...]
+    transitions: Dict[int, int]
+    terminals: array[int]
+    def __init__(self, emojis: Iterable[str]): ...
+    def step(self, state: int, char: str) -> int: ...
+    def emoji_index(self, state: int) -> int | None: ...
+    def index_of(self, emoji: str) -> int | None: ...
+    def __len__(self) -> int: ...
+
+
+class PhraseAutomaton:
+    phrases: Tuple[str, ...]
+    words: Dict[str, int]
+    transitions: Dict[int, int]
+    terminals: array[int]
+    depths: array[int]
+    fails: array[int]
+    outputs: array[int]
+    def __init__(self, phrases: Iterable[str]): ...
+    def finditer(self, string: str) -> Iterator[Tuple[int, int, int]]: ...
+    def __len__(self) -> int: ...
+
+
+class EmojiMatches:
+    string: str
+    starts: array[int]
+    ends: array[int]
+    ids: array[int]
+    def __init__(self, string: str, keep_zwj: bool = ...): ...
+    def __len__(self) -> int: ...
+    @overload
+    def __getitem__(self, index: int) -> EmojiMatch: ...
+    @overload
+    def __getitem__(self, index: slice) -> EmojiMatches: ...
+    def __iter__(self) -> Iterator[EmojiMatch]: ...
+    def emojis(self) -> List[str]: ...
+    def counts(self) -> Dict[str, int]: ...
+    def filter(self, ids: Iterable[int]) -> EmojiMatches: ...
+    def to_list(self) -> List[Dict[str, Any]]: ...
+
+
+class StreamTokenizer:
+    keep_zwj: bool
+    def __init__(self, keep_zwj: bool): ...
+    def feed(self, chunk: str) -> List[Token]: ...
+    def close(self) -> List[Token]: ...
+
+
+def tokenize(string, keep_zwj: bool, backend: str = ...) -> Iterator[Token]: ...
+
+
+def tokenize_spans(string, keep_zwj: bool) -> Iterator[Token]: ...
+
+
+def tokenize_bytes(data: bytes | bytearray | memoryview | mmap, keep_zwj: bool) -> Iterator[Token]: ...
+
+
+def iter_matches(string, keep_zwj: bool = ...) -> Iterator[Tuple[int, int, int]]: ...
+
+
+def retokenize(string, matches: List[Tuple[int, int, int]], offset: int, removed: int,
+               inserted: str) -> Tuple[str, List[Tuple[int, int, int]]]: ...
+
+
+def collect_matches(string, starts: array[int], ends: array[int],
+                    indexes: array[int], keep_zwj: bool = ...) -> int: ...
 
 
 def filter_tokens(matches: Iterator[Token], emoji_only: bool,
@@ -45,3 +115,20 @@ def filter_tokens(matches: Iterator[Token], emoji_only: bool,
 
 
 def get_search_tree() -> _SearchTree: ...
+
+
+def get_automaton() -> EmojiAutomaton: ...
+
+
+@overload
+def get_emoji_regex(policy: str = ..., binary: Literal[False] = ...) -> re.Pattern[str]: ...
+@overload
+def get_emoji_regex(policy: str, binary: Literal[True]) -> re.Pattern[bytes]: ...
+@overload
+def get_emoji_regex(*, binary: Literal[True]) -> re.Pattern[bytes]: ...
+
+
+def get_trie_pattern(strings: Iterable[str]) -> str: ...
+
+
+def get_emoji_start_chars() -> FrozenSet[str]: ...